@@ -15,11 +15,10 @@ def get_connector(request: Request) -> JobExtractor:
     return connector
 
 
-def get_extraction_service(
-    connector: Annotated[JobExtractor, Depends(get_connector)],
-) -> ExtractionService:
-    """Get extraction service with injected dependencies."""
-    return ExtractionService(connector=connector)
+def get_extraction_service(request: Request) -> ExtractionService:
+    """Get the lifespan-managed extraction service from app state."""
+    service: ExtractionService = request.app.state.extraction_service
+    return service
 
 
 # Type aliases for cleaner route signatures
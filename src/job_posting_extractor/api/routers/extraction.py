@@ -1,14 +1,43 @@
 """Extraction-related API endpoints."""
 
-from fastapi import APIRouter
+import logging
+from collections.abc import AsyncIterator
+from typing import Annotated
+
+from fastapi import APIRouter, Body
+from fastapi.responses import StreamingResponse
 
 from job_posting_extractor.api.dependencies import ExtractionServiceDep
+from job_posting_extractor.api.routing import ORJSONRoute
+from job_posting_extractor.exceptions import BusinessError, ExtractionError
 from job_posting_extractor.models import (
+    ExtractionErrorDetail,
+    JobExtractionItemResult,
     JobExtractionRequest,
     JobExtractionResponse,
+    JobFieldEvent,
 )
 
-router = APIRouter(tags=["extraction"])
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["extraction"], route_class=ORJSONRoute)
+
+
+def _to_item_results(
+    results: list[JobExtractionResponse | ExtractionError],
+) -> list[JobExtractionItemResult]:
+    """Convert per-posting results into index-aligned response items."""
+    return [
+        JobExtractionItemResult(
+            index=index,
+            error=ExtractionErrorDetail(
+                detail=result.message, error_code=result.error_code
+            ),
+        )
+        if isinstance(result, ExtractionError)
+        else JobExtractionItemResult(index=index, result=result)
+        for index, result in enumerate(results)
+    ]
 
 
 @router.post(
@@ -32,3 +61,94 @@ async def extract_job_handler(
     - Application info
     """
     return await service.extract_job(request.text)
+
+
+def _sse_event(event: str, data: str) -> bytes:
+    """Encode one Server-Sent Event."""
+    return f"event: {event}\ndata: {data}\n\n".encode()
+
+
+async def _to_sse_events(
+    events: AsyncIterator[JobFieldEvent | JobExtractionResponse],
+) -> AsyncIterator[bytes]:
+    """Encode a streamed extraction as `field`, `result` and `error` events."""
+    try:
+        async for event in events:
+            if isinstance(event, JobFieldEvent):
+                yield _sse_event("field", event.model_dump_json())
+            else:
+                yield _sse_event("result", event.model_dump_json())
+    except BusinessError as e:
+        # Headers are already sent, so errors are reported in-stream
+        detail = ExtractionErrorDetail(detail=e.message, error_code=e.error_code)
+        yield _sse_event("error", detail.model_dump_json())
+    except Exception:
+        # Like the catch-all handler, but the stream still needs a final event
+        logger.exception("Streamed extraction failed")
+        detail = ExtractionErrorDetail(
+            detail="Internal server error", error_code="INTERNAL_ERROR"
+        )
+        yield _sse_event("error", detail.model_dump_json())
+
+
+@router.post(
+    "/extract/job/stream",
+    response_class=StreamingResponse,
+    summary="Stream structured data from job posting text",
+)
+async def stream_extract_job_handler(
+    request: JobExtractionRequest,
+    service: ExtractionServiceDep,
+) -> StreamingResponse:
+    """
+    Extract job posting data as a stream of Server-Sent Events.
+
+    Emits a `field` event (`{"field": ..., "value": ...}`) for each top-level
+    field as soon as it has been generated, then a `result` event with the
+    full extraction response including confidence and usage. Field values
+    are unvalidated previews; the `result` event is authoritative. Failures
+    after the stream has started are sent as an `error` event.
+    """
+    events = service.stream_extract(request.text)
+    return StreamingResponse(_to_sse_events(events), media_type="text/event-stream")
+
+
+@router.post(
+    "/extract/jobs/parallel",
+    response_model=list[JobExtractionItemResult],
+    summary="Extract many job postings concurrently",
+)
+async def extract_jobs_parallel_handler(
+    requests: Annotated[list[JobExtractionRequest], Body(min_length=1)],
+    service: ExtractionServiceDep,
+) -> list[JobExtractionItemResult]:
+    """
+    Extract structured data from many job postings in parallel.
+
+    Postings are extracted concurrently, bounded by the server's concurrency
+    and rate limits. Results are returned in request order; each item carries
+    either the extraction result or the error for that posting.
+    """
+    results = await service.extract_jobs([request.text for request in requests])
+    return _to_item_results(results)
+
+
+@router.post(
+    "/extract/jobs/batch",
+    response_model=list[JobExtractionItemResult],
+    summary="Extract many job postings via the Message Batches API",
+)
+async def extract_jobs_batch_handler(
+    requests: Annotated[list[JobExtractionRequest], Body(min_length=1)],
+    service: ExtractionServiceDep,
+) -> list[JobExtractionItemResult]:
+    """
+    Extract structured data from many job postings in a single batch.
+
+    Uses Anthropic's Message Batches API, which is cheaper per token but
+    finishes asynchronously: the request stays open until the batch has ended.
+    Results are returned in request order; each item carries either the
+    extraction result or the error for that posting.
+    """
+    results = await service.extract_jobs_batch([request.text for request in requests])
+    return _to_item_results(results)
@@ -1,18 +1,32 @@
 """FastAPI application factory using composition pattern."""
 
+import sys
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from typing import Final
 
+import orjson
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from job_posting_extractor import __version__
+from job_posting_extractor.api.routers import extraction_router
 from job_posting_extractor.config import LLMProvider, get_settings
-from job_posting_extractor.connectors.base import JobExtractor
+from job_posting_extractor.connectors.base import BatchJobExtractor, JobExtractor
 from job_posting_extractor.connectors.claude import ClaudeConnector
 from job_posting_extractor.connectors.mock_claude import MockClaudeConnector
 from job_posting_extractor.connectors.openai_compat import OpenAICompatConnector
-from job_posting_extractor.exceptions import BusinessError
+from job_posting_extractor.exceptions import (
+    BusinessError,
+    ConfigurationError,
+    RequestTooLargeError,
+)
+from job_posting_extractor.services.extraction import ExtractionService
+from job_posting_extractor.services.parallel import AsyncLimiter, MicroBatcher
+
+# Static for the process lifetime, so serialized once rather than per request
+_HEALTH_BODY: Final[bytes] = orjson.dumps({"status": "healthy", "version": __version__})
 
 
 @asynccontextmanager
@@ -23,6 +37,9 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     Handles:
     - Configuration validation on startup
     - LLM connector initialization (Claude, OpenAI-compatible, or mock)
+    - Extraction service setup with this worker's share of the rate limits
+    - Optional micro-batcher and semantic cache for single extractions
+    - Optional persistent cache shared across workers
     - Resource cleanup on shutdown
     """
     settings = get_settings()
@@ -38,33 +55,158 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     await connector.initialize()
     app.state.llm_connector = connector
 
+    batcher = None
+    if settings.enable_microbatching:
+        if not isinstance(connector, BatchJobExtractor):
+            raise ConfigurationError(
+                "Micro-batching requires an LLM provider with batch support"
+            )
+        batcher = MicroBatcher(
+            connector.extract_job_postings_batch,
+            max_size=settings.batch_max_size,
+            window=settings.batch_window_ms / 1000,
+        )
+        batcher.start()
+
+    semantic_cache = None
+    if settings.semantic_cache_enabled:
+        # Optional extra, so only imported when enabled
+        from job_posting_extractor.services.semantic_cache import (
+            FastEmbedEmbedder,
+            SemanticCache,
+        )
+
+        semantic_cache = SemanticCache(
+            FastEmbedEmbedder(settings.semantic_cache_model),
+            threshold=settings.semantic_cache_threshold,
+            min_chars=settings.semantic_cache_min_chars,
+            max_entries=settings.extraction_cache_size,
+            ttl=settings.extraction_cache_ttl,
+        )
+
+    persistent_cache = None
+    if settings.persistent_cache_path is not None:
+        # Optional extra, so only imported when enabled
+        from job_posting_extractor.services.persistent_cache import ExtractionCache
+
+        persistent_cache = ExtractionCache(
+            settings.persistent_cache_path, ttl=settings.extraction_cache_ttl
+        )
+        await persistent_cache.open()
+
+    # Every worker process has its own limiter, so each enforces an equal
+    # share of the configured limits to keep the total within quota
+    workers = settings.worker_count
+    limiter = AsyncLimiter(
+        rpm=max(1, settings.rate_limit_rpm // workers),
+        tpm=max(1, settings.rate_limit_tpm // workers),
+    )
+
+    # Share one service so the rate limiter covers every direct request
+    app.state.extraction_service = ExtractionService(
+        connector=connector,
+        limiter=limiter,
+        max_concurrency=settings.max_concurrency,
+        batcher=batcher,
+        cache_size=settings.extraction_cache_size,
+        cache_ttl=settings.extraction_cache_ttl,
+        semantic_cache=semantic_cache,
+        persistent_cache=persistent_cache,
+        cache_namespace=settings.extraction_cache_namespace,
+    )
+
     yield
 
     # Cleanup on shutdown
+    if batcher is not None:
+        await batcher.stop()
+    if persistent_cache is not None:
+        await persistent_cache.close()
     await connector.cleanup()
 
 
-def business_exception_handler(_request: Request, exc: BusinessError) -> JSONResponse:
+def business_exception_handler(_request: Request, exc: BusinessError) -> ORJSONResponse:
     """Handle application-specific business exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.message, "error_code": exc.error_code},
     )
 
 
-def general_exception_handler(_request: Request, _exc: Exception) -> JSONResponse:
+def general_exception_handler(_request: Request, _exc: Exception) -> ORJSONResponse:
     """Catch-all handler for unexpected exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error"},
     )
 
 
+class RequestSizeLimitMiddleware:
+    """Reject request bodies larger than `max_bytes` with a 413.
+
+    A declared Content-Length over the limit is rejected before the body is
+    read. Otherwise, e.g. for chunked bodies, bytes are counted as they are
+    received and reading stops once the limit is passed.
+    """
+
+    def __init__(self, app: ASGIApp, max_bytes: int) -> None:
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit() and int(value) > self.max_bytes:
+                    await self._reject(scope, receive, send)
+                    return
+                break
+
+        received = 0
+        too_large = False
+
+        async def receive_limited() -> Message:
+            nonlocal received, too_large
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    too_large = True
+                    # Stops the app reading; its error response is replaced
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def send_unless_too_large(message: Message) -> None:
+            if not too_large:
+                await send(message)
+
+        try:
+            await self.app(scope, receive_limited, send_unless_too_large)
+        except Exception:
+            if not too_large:
+                raise
+        if too_large:
+            await self._reject(scope, receive, send)
+
+    async def _reject(self, scope: Scope, receive: Receive, send: Send) -> None:
+        response = business_exception_handler(
+            Request(scope),
+            RequestTooLargeError(
+                f"Request body too large (max {self.max_bytes:,} bytes)"
+            ),
+        )
+        await response(scope, receive, send)
+
+
 def create_app() -> FastAPI:
     """
     Application factory using composition pattern.
 
     Creates and configures the FastAPI application with:
+    - Request body size limit
     - Exception handlers
     - API routers
     - Health check endpoints
@@ -77,8 +219,12 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
+    # Reject oversized bodies before they are parsed
+    app.add_middleware(RequestSizeLimitMiddleware, max_bytes=settings.max_request_bytes)
+
     # Exception handlers
     # Ignore arg-type: FastAPI's add_exception_handler typing is overly strict
     # and doesn't account for exception subclasses being valid handlers
@@ -86,16 +232,13 @@ def create_app() -> FastAPI:
     app.add_exception_handler(Exception, general_exception_handler)
 
     # Register API routers
-    # (Lazy router import inside the function to avoid circular imports and
-    # reduce startup time if the factory isn't called)
-    from job_posting_extractor.api.routers import extraction_router
-
     app.include_router(extraction_router, prefix="/api/v1")
 
-    # Health check endpoints
-    @app.get("/health")
-    async def health_check() -> dict[str, str]:
-        return {"status": "healthy", "version": __version__}
+    # Health check endpoints; no response model, so the prebuilt body is
+    # sent without being validated and re-serialized per request
+    @app.get("/health", response_model=None)
+    async def health_check() -> Response:
+        return Response(_HEALTH_BODY, media_type="application/json")
 
     return app
 
@@ -112,5 +255,10 @@ def start_api() -> None:
         host=settings.host,
         port=settings.port,
         reload=settings.reload,
+        workers=settings.worker_count,
         log_level=settings.log_level,
+        # Faster event loop and HTTP parser than the asyncio/h11 fallbacks;
+        # uvloop does not support Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
     )
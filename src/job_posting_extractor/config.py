@@ -1,5 +1,6 @@
 """Configuration settings for the application using pydantic-settings."""
 
+import os
 from enum import StrEnum
 from functools import cache
 
@@ -29,6 +30,8 @@ class Settings(BaseSettings):
     port: int = 8000
     reload: bool = False
     log_level: str = "info"
+    workers: int = 1  # 0 starts one worker per CPU
+    max_request_bytes: int = 200_000
 
     # LLM provider selection
     llm_provider: LLMProvider = LLMProvider.CLAUDE
@@ -36,6 +39,7 @@ class Settings(BaseSettings):
     # Anthropic API settings
     anthropic_api_key: SecretStr | None = None
     claude_model: str = "claude-sonnet-4-5-20250929"
+    use_minimal_tool_schema: bool = False
 
     # OpenAI-compatible API settings (for LM Studio, Ollama, vLLM, etc.)
     openai_api_key: SecretStr = SecretStr("lm-studio")
@@ -45,6 +49,40 @@ class Settings(BaseSettings):
     # Shared LLM settings
     max_tokens: int = 1024
     api_timeout: float = 60.0
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    warmup_on_startup: bool = True
+
+    # Concurrent extraction settings (shared across all requests)
+    max_concurrency: int = 10
+    # Per-key LLM quota for direct requests, split evenly between workers
+    rate_limit_rpm: int = 50
+    rate_limit_tpm: int = 30_000
+
+    # Extraction result cache (0 disables caching)
+    extraction_cache_size: int = 1024
+    extraction_cache_ttl: int = 3600
+
+    # SQLite cache shared across workers and restarts (requires the sqlite
+    # extra; unset disables it)
+    persistent_cache_path: str | None = None
+
+    # Semantic cache for near-duplicate postings (requires the semantic extra)
+    semantic_cache_enabled: bool = False
+    semantic_cache_model: str = "BAAI/bge-small-en-v1.5"
+    semantic_cache_threshold: float = 0.95
+    semantic_cache_min_chars: int = 200
+
+    # Message Batches API settings (Claude only)
+    batch_poll_interval: float = 20.0
+    batch_poll_max_interval: float = 300.0
+    batch_max_wait: float = 3600.0
+
+    # Group single extractions into batches (opt-in; adds up to the window
+    # plus batch processing time to each request)
+    enable_microbatching: bool = False
+    batch_window_ms: int = 100
+    batch_max_size: int = 32
 
     # Mock settings
     mock_llm: bool = False
@@ -65,6 +103,21 @@ class Settings(BaseSettings):
             )
         return self
 
+    @property
+    def worker_count(self) -> int:
+        """Number of server processes; uvicorn ignores workers when reloading."""
+        if self.reload:
+            return 1
+        return self.workers or os.cpu_count() or 1
+
+    @property
+    def extraction_cache_namespace(self) -> str:
+        """Settings besides the model that change extraction results."""
+        return (
+            f"max_tokens={self.max_tokens},"
+            f"minimal_tool_schema={self.use_minimal_tool_schema}"
+        )
+
     @property
     def api_key(self) -> SecretStr:
         """Get the Anthropic API key. Only valid when using Claude provider."""
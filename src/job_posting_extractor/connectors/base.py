@@ -1,11 +1,12 @@
 """Connector protocol for external service integrations."""
 
+from collections.abc import AsyncIterator
 from typing import Any, Protocol, runtime_checkable
 
-from job_posting_extractor.models import RawExtractionResult
+from job_posting_extractor.exceptions import ExtractionError
+from job_posting_extractor.models import JobFieldEvent, RawExtractionResult
 
 
-@runtime_checkable
 class Connector(Protocol):
     """
     Base protocol for all external service connectors.
@@ -28,7 +29,6 @@ class Connector(Protocol):
         ...
 
 
-@runtime_checkable
 class JobExtractor(Connector, Protocol):
     """
     Protocol for connectors that can extract job postings.
@@ -36,6 +36,45 @@ class JobExtractor(Connector, Protocol):
     Extends Connector with job extraction capability.
     """
 
+    @property
+    def model(self) -> str:
+        """Identifier of the model used for extractions."""
+        ...
+
     async def extract_job_posting(self, job_text: str) -> RawExtractionResult:
         """Extract structured job posting data from text."""
         ...
+
+
+@runtime_checkable
+class BatchJobExtractor(JobExtractor, Protocol):
+    """
+    Protocol for connectors that can extract many job postings in one batch.
+
+    Extends JobExtractor with bulk extraction. Results are returned in input
+    order; failed postings are returned as ExtractionError instead of raising.
+    Runtime-checkable because batch support is detected with isinstance.
+    """
+
+    async def extract_job_postings_batch(
+        self, job_texts: list[str]
+    ) -> list[RawExtractionResult | ExtractionError]:
+        """Extract structured job posting data from many texts."""
+        ...
+
+
+@runtime_checkable
+class StreamingJobExtractor(JobExtractor, Protocol):
+    """
+    Protocol for connectors that can stream a job extraction.
+
+    Extends JobExtractor with incremental output: top-level fields are
+    yielded as they complete, followed by the full result as the last item.
+    Runtime-checkable because streaming support is detected with isinstance.
+    """
+
+    def stream_job_posting(
+        self, job_text: str
+    ) -> AsyncIterator[JobFieldEvent | RawExtractionResult]:
+        """Stream structured job posting data extracted from text."""
+        ...
@@ -1,10 +1,30 @@
 """Claude API connector for interacting with Anthropic's Claude models."""
 
-from typing import Any, Never, Self
+import asyncio
+import hashlib
+import logging
+from collections.abc import AsyncIterator
+from contextlib import suppress
+from functools import partial
+from time import monotonic
+from typing import Any, Never, Self, TypedDict
 
 import anthropic
 import httpx
-from anthropic.types import TextBlock, ToolParam, ToolUseBlock
+import orjson
+from anthropic.types import (
+    Message,
+    TextBlock,
+    ToolChoiceToolParam,
+    ToolParam,
+    ToolUseBlock,
+)
+from anthropic.types.message_create_params import MessageCreateParamsNonStreaming
+from anthropic.types.messages import (
+    MessageBatchErroredResult,
+    MessageBatchIndividualResponse,
+    MessageBatchSucceededResult,
+)
 from pydantic import ValidationError
 from tenacity import (
     retry,
@@ -19,17 +39,20 @@ from job_posting_extractor.connectors.shared import (
     EXTRACTION_SYSTEM_PROMPT,
     JOB_EXTRACTION_PROPERTIES,
     JOB_EXTRACTION_REQUIRED_FIELDS,
+    JOB_POSTING_ADAPTER,
     RETRYABLE_STATUS_CODES,
     validate_message,
 )
 from job_posting_extractor.exceptions import ExtractionError
 from job_posting_extractor.models import (
     ClaudeResponse,
-    JobPosting,
+    JobFieldEvent,
     RawExtractionResult,
     UsageInfo,
 )
 
+logger = logging.getLogger(__name__)
+
 JOB_EXTRACTION_TOOL: ToolParam = {
     "name": "extract_job_posting",
     "description": "Extract structured job posting information from text",
@@ -41,10 +64,68 @@ JOB_EXTRACTION_TOOL: ToolParam = {
 }
 
 
+def _strip_descriptions(schema: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of a JSON schema without any "description" keywords."""
+    stripped: dict[str, Any] = {}
+    for key, value in schema.items():
+        if key == "description":
+            continue
+        if key == "properties":
+            # Keys here are field names, not schema keywords
+            stripped[key] = {
+                name: _strip_descriptions(prop) for name, prop in value.items()
+            }
+        elif isinstance(value, dict):
+            stripped[key] = _strip_descriptions(value)
+        else:
+            stripped[key] = value
+    return stripped
+
+
+# Same tool without per-field descriptions, to save input tokens per request
+_JOB_EXTRACTION_TOOL_MIN: ToolParam = {
+    "name": "extract_job_posting",
+    "description": "Extract structured job posting information from text",
+    "input_schema": _strip_descriptions(
+        {
+            "type": "object",
+            "properties": JOB_EXTRACTION_PROPERTIES,
+            "required": JOB_EXTRACTION_REQUIRED_FIELDS,
+        }
+    ),
+}
+
+# Static request parts, built once instead of per extraction call
+_TOOLS: list[ToolParam] = [JOB_EXTRACTION_TOOL]
+_TOOLS_MIN: list[ToolParam] = [_JOB_EXTRACTION_TOOL_MIN]
+_TOOL_CHOICE: ToolChoiceToolParam = {"type": "tool", "name": "extract_job_posting"}
+
+
+class _StaticExtractionParams(TypedDict):
+    """Per-connector Messages API parameters that don't depend on the job text."""
+
+    model: str
+    max_tokens: int
+    system: str
+    tools: list[ToolParam]
+    tool_choice: ToolChoiceToolParam
+
+
+def _batch_custom_id(index: int) -> str:
+    """Build the custom_id used to match batch results back to their input."""
+    return f"job-{index}"
+
+
+# Network and rate limit errors are always retryable
+_RETRYABLE_EXC: tuple[type[BaseException], ...] = (
+    anthropic.RateLimitError,
+    anthropic.APIConnectionError,
+)
+
+
 def _is_retryable_error(exc: BaseException) -> bool:
     """Determine if an API error is retryable."""
-    # Network and rate limit errors are always retryable
-    if isinstance(exc, (anthropic.RateLimitError, anthropic.APIConnectionError)):
+    if isinstance(exc, _RETRYABLE_EXC):
         return True
 
     # Server errors (5xx) and rate limits (429) are retryable
@@ -59,16 +140,51 @@ class ClaudeConnector:
 
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
+        # One pooled HTTP/2 client for the connector lifetime, sized for the
+        # configured concurrency so bursts reuse warm connections
+        self._http = anthropic.DefaultAsyncHttpxClient(
+            timeout=httpx.Timeout(settings.api_timeout, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_keepalive_connections,
+            ),
+            http2=True,
+        )
         self.client = anthropic.AsyncAnthropic(
             api_key=settings.api_key.get_secret_value(),
             timeout=httpx.Timeout(settings.api_timeout, connect=10.0),
+            http_client=self._http,
+            # Retries are handled by tenacity; SDK retries would multiply them
+            max_retries=0,
         )
+        # Request parameters that are identical for every extraction
+        self._static_params: _StaticExtractionParams = {
+            "model": settings.claude_model,
+            "max_tokens": settings.max_tokens,
+            "system": EXTRACTION_SYSTEM_PROMPT,
+            "tools": _TOOLS_MIN if settings.use_minimal_tool_schema else _TOOLS,
+            "tool_choice": _TOOL_CHOICE,
+        }
+        # Extractions currently running, keyed by a hash of the job text
+        self._inflight: dict[str, asyncio.Task[RawExtractionResult]] = {}
+
+    @property
+    def model(self) -> str:
+        """Claude model used for extractions."""
+        return self.settings.claude_model
 
     async def initialize(self) -> None:
-        """Initialize connector resources. No-op as client is created in __init__."""
+        """Warm up the connection pool so the first request skips DNS/TLS setup."""
+        if not self.settings.warmup_on_startup:
+            return
+        try:
+            await self._http.head(str(self.client.base_url), timeout=5.0)
+        except httpx.HTTPError as e:
+            # Warmup is best effort; real requests will connect on demand
+            logger.debug("Claude connection warmup failed: %s", e)
 
     async def cleanup(self) -> None:
-        """Cleanup client resources."""
+        """Cleanup client resources (also closes the shared HTTP client)."""
         await self.client.close()
 
     async def __aenter__(self) -> Self:
@@ -115,10 +231,12 @@ class ClaudeConnector:
                     f"Unexpected response type: {type(content_block).__name__}"
                 )
 
-            return ClaudeResponse(
+            # model_construct skips validation; only safe because every field
+            # comes from an already-validated SDK Message
+            return ClaudeResponse.model_construct(
                 response=content_block.text,
                 model=response.model,
-                usage=UsageInfo(
+                usage=UsageInfo.model_construct(
                     input_tokens=response.usage.input_tokens,
                     output_tokens=response.usage.output_tokens,
                 ),
@@ -138,17 +256,65 @@ class ClaudeConnector:
             raise error
         raise ExtractionError(f"Claude API error: {error}") from error
 
-    @retry(
-        retry=retry_if_exception(_is_retryable_error),
-        wait=wait_exponential(multiplier=1, min=1, max=60),
-        stop=stop_after_attempt(3),
-        reraise=True,
-    )
+    def _extraction_params(self, job_text: str) -> MessageCreateParamsNonStreaming:
+        """Build the Messages API parameters for a job extraction request."""
+        return {
+            **self._static_params,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": EXTRACTION_PROMPT + job_text,
+                }
+            ],
+        }
+
+    @staticmethod
+    def _parse_extraction_response(response: Message) -> RawExtractionResult:
+        """Build a RawExtractionResult from a tool_use Messages API response."""
+        # With a forced tool_choice the tool block is normally first; only scan
+        # when other blocks (e.g. TextBlock, ThinkingBlock) come before it
+        first = response.content[0] if response.content else None
+        tool_use_block = (
+            first
+            if isinstance(first, ToolUseBlock)
+            else next(
+                (b for b in response.content if isinstance(b, ToolUseBlock)), None
+            )
+        )
+
+        if tool_use_block is None:
+            raise ExtractionError("Claude did not return structured output")
+
+        job_data = tool_use_block.input
+        if not isinstance(job_data, dict):
+            raise ExtractionError(
+                f"Unexpected tool input type: {type(job_data).__name__}"
+            )
+
+        try:
+            job = JOB_POSTING_ADAPTER.validate_python(job_data)
+        except ValidationError as e:
+            raise ExtractionError(f"Invalid job data structure: {e}") from e
+
+        # The job was validated above and the rest comes from the SDK Message,
+        # so the wrappers can skip revalidation. Never model_construct
+        # anything built from untrusted input.
+        return RawExtractionResult.model_construct(
+            job=job,
+            raw_response=orjson.dumps(job_data).decode(),
+            model=response.model,
+            usage=UsageInfo.model_construct(
+                input_tokens=response.usage.input_tokens,
+                output_tokens=response.usage.output_tokens,
+            ),
+        )
+
     async def extract_job_posting(self, job_text: str) -> RawExtractionResult:
         """
         Extract structured job posting data from unstructured text.
 
         Uses Claude's tool_use feature for guaranteed structured output.
+        Concurrent calls with identical text share a single API request.
 
         Args:
             job_text: Raw job posting text to parse.
@@ -161,54 +327,230 @@ class ClaudeConnector:
         """
         self._validate_message(job_text)
 
+        key = hashlib.blake2b(job_text.encode(), digest_size=16).hexdigest()
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._extract_job_posting(job_text))
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._finish_inflight, key))
+        # Shield so one caller disconnecting doesn't cancel the shared request
+        return await asyncio.shield(task)
+
+    def _finish_inflight(
+        self, key: str, task: asyncio.Task[RawExtractionResult]
+    ) -> None:
+        """Drop a finished shared request and mark its exception retrieved."""
+        self._inflight.pop(key, None)
+        # If every waiter disconnected, nobody else reads the exception and
+        # asyncio would log "Task exception was never retrieved"
+        if not task.cancelled():
+            task.exception()
+
+    @retry(
+        retry=retry_if_exception(_is_retryable_error),
+        wait=wait_exponential(multiplier=1, min=1, max=60),
+        stop=stop_after_attempt(3),
+        reraise=True,
+    )
+    async def _extract_job_posting(self, job_text: str) -> RawExtractionResult:
+        """Run a single extraction request against the Messages API."""
         try:
             response = await self.client.messages.create(
-                model=self.settings.claude_model,
-                max_tokens=self.settings.max_tokens,
-                system=EXTRACTION_SYSTEM_PROMPT,
-                tools=[JOB_EXTRACTION_TOOL],
-                tool_choice={"type": "tool", "name": "extract_job_posting"},
-                messages=[
-                    {
-                        "role": "user",
-                        "content": f"{EXTRACTION_PROMPT}{job_text}",
-                    }
-                ],
+                **self._extraction_params(job_text)
             )
+            return self._parse_extraction_response(response)
 
-            # Get ToolUseBlock in case there are more Blocks (e.g. TextBlock, ThinkingBlock)
-            tool_use_block = None
-            for block in response.content:
-                if isinstance(block, ToolUseBlock):
-                    tool_use_block = block
-                    break
+        except anthropic.APIError as e:
+            self._handle_api_error(e)
+        except ExtractionError:
+            raise
+        except Exception as e:
+            raise ExtractionError(f"Error extracting job posting: {e}") from e
 
-            if tool_use_block is None:
-                raise ExtractionError("Claude did not return structured output")
+    async def stream_job_posting(
+        self, job_text: str
+    ) -> AsyncIterator[JobFieldEvent | RawExtractionResult]:
+        """
+        Stream structured job posting data as Claude generates it.
 
-            job_data = tool_use_block.input
-            if not isinstance(job_data, dict):
-                raise ExtractionError(
-                    f"Unexpected tool input type: {type(job_data).__name__}"
-                )
+        Top-level fields are yielded as soon as the next field starts, and
+        the full RawExtractionResult last. Not retried, since fields may
+        already have been consumed when an error occurs.
 
-            job = JobPosting(**job_data)
+        Args:
+            job_text: Raw job posting text to parse.
 
-            return RawExtractionResult(
-                job=job,
-                raw_response=str(job_data),
-                model=response.model,
-                usage=UsageInfo(
-                    input_tokens=response.usage.input_tokens,
-                    output_tokens=response.usage.output_tokens,
-                ),
-            )
+        Yields:
+            JobFieldEvent per completed field, then the RawExtractionResult.
 
+        Raises:
+            ExtractionError: If extraction or parsing fails.
+        """
+        self._validate_message(job_text)
+
+        emitted = 0
+        try:
+            # Not _extraction_params: that is typed for non-streaming requests
+            async with self.client.messages.stream(
+                **self._static_params,
+                messages=[{"role": "user", "content": EXTRACTION_PROMPT + job_text}],
+            ) as stream:
+                async for event in stream:
+                    if event.type != "input_json" or not isinstance(
+                        event.snapshot, dict
+                    ):
+                        continue
+                    # Every field but the last is complete once a later one starts
+                    fields = list(event.snapshot.items())[:-1]
+                    for name, value in fields[emitted:]:
+                        yield JobFieldEvent(field=name, value=value)
+                    emitted = max(emitted, len(fields))
+                response = await stream.get_final_message()
         except anthropic.APIError as e:
-            self._handle_api_error(e)
-        except ValidationError as e:
-            raise ExtractionError(f"Invalid job data structure: {e}") from e
+            raise ExtractionError(f"Claude API error: {e}") from e
         except ExtractionError:
             raise
         except Exception as e:
             raise ExtractionError(f"Error extracting job posting: {e}") from e
+
+        result = self._parse_extraction_response(response)
+        # The remaining fields only complete with the message
+        job_data = orjson.loads(result.raw_response)
+        for name, value in list(job_data.items())[emitted:]:
+            yield JobFieldEvent(field=name, value=value)
+        yield result
+
+    async def extract_job_postings_batch(
+        self, job_texts: list[str]
+    ) -> list[RawExtractionResult | ExtractionError]:
+        """
+        Extract many job postings in one request via the Message Batches API.
+
+        Batches are processed asynchronously at a discount, trading end-to-end
+        latency for throughput and cost. The batch is polled with exponential
+        backoff until it has ended, and cancelled if it has not ended within
+        `batch_max_wait` seconds.
+
+        Args:
+            job_texts: Raw job posting texts to parse.
+
+        Returns:
+            One entry per input text, in input order: a RawExtractionResult on
+            success, or an ExtractionError if that posting was invalid or
+            failed. Invalid postings are not submitted.
+
+        Raises:
+            ExtractionError: If the batch cannot be run or does not end in time.
+        """
+        results: dict[str, RawExtractionResult | ExtractionError] = {}
+        requests: dict[str, str] = {}
+        for index, job_text in enumerate(job_texts):
+            custom_id = _batch_custom_id(index)
+            try:
+                self._validate_message(job_text)
+            except ExtractionError as e:
+                results[custom_id] = e
+            else:
+                requests[custom_id] = job_text
+
+        if requests:
+            results |= await self._run_batch(requests)
+
+        return [
+            results.get(
+                _batch_custom_id(index),
+                ExtractionError("Claude batch returned no result for this posting"),
+            )
+            for index in range(len(job_texts))
+        ]
+
+    async def _run_batch(
+        self, requests: dict[str, str]
+    ) -> dict[str, RawExtractionResult | ExtractionError]:
+        """Submit texts keyed by custom_id and wait for their results."""
+        try:
+            batch_id = await self._create_batch(requests)
+            # Set once, so retried polls don't restart the clock
+            deadline = monotonic() + self.settings.batch_max_wait
+            await self._wait_for_batch(batch_id, deadline)
+            return await self._fetch_batch_results(batch_id)
+        except anthropic.APIError as e:
+            raise ExtractionError(f"Claude batch API error: {e}") from e
+
+    @retry(
+        retry=retry_if_exception(_is_retryable_error),
+        wait=wait_exponential(multiplier=1, min=1, max=60),
+        stop=stop_after_attempt(3),
+        reraise=True,
+    )
+    async def _create_batch(self, requests: dict[str, str]) -> str:
+        """Submit one extraction request per text and return the batch ID."""
+        batch = await self.client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": custom_id,
+                    "params": self._extraction_params(job_text),
+                }
+                for custom_id, job_text in requests.items()
+            ]
+        )
+        return batch.id
+
+    @retry(
+        retry=retry_if_exception(_is_retryable_error),
+        wait=wait_exponential(multiplier=1, min=1, max=60),
+        stop=stop_after_attempt(3),
+        reraise=True,
+    )
+    async def _wait_for_batch(self, batch_id: str, deadline: float) -> None:
+        """Poll a message batch with exponential backoff until it has ended.
+
+        Raises:
+            ExtractionError: If the batch has not ended by the deadline; the
+                batch is cancelled so its results aren't billed unused.
+        """
+        delay = self.settings.batch_poll_interval
+        while True:
+            batch = await self.client.messages.batches.retrieve(batch_id)
+            if batch.processing_status == "ended":
+                return
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                with suppress(anthropic.APIError):
+                    await self.client.messages.batches.cancel(batch_id)
+                raise ExtractionError(
+                    f"Claude batch {batch_id} did not end within "
+                    f"{self.settings.batch_max_wait:g} seconds"
+                )
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, self.settings.batch_poll_max_interval)
+
+    @retry(
+        retry=retry_if_exception(_is_retryable_error),
+        wait=wait_exponential(multiplier=1, min=1, max=60),
+        stop=stop_after_attempt(3),
+        reraise=True,
+    )
+    async def _fetch_batch_results(
+        self, batch_id: str
+    ) -> dict[str, RawExtractionResult | ExtractionError]:
+        """Download and parse the results of an ended batch, keyed by custom_id."""
+        # Results are not guaranteed to be in request order
+        results: dict[str, RawExtractionResult | ExtractionError] = {}
+        async for entry in await self.client.messages.batches.results(batch_id):
+            results[entry.custom_id] = self._parse_batch_result(entry)
+        return results
+
+    def _parse_batch_result(
+        self, entry: MessageBatchIndividualResponse
+    ) -> RawExtractionResult | ExtractionError:
+        """Convert a single batch result into a RawExtractionResult or error."""
+        result = entry.result
+        if isinstance(result, MessageBatchSucceededResult):
+            try:
+                return self._parse_extraction_response(result.message)
+            except ExtractionError as e:
+                return e
+        if isinstance(result, MessageBatchErroredResult):
+            return ExtractionError(f"Claude API error: {result.error.error.message}")
+        return ExtractionError(f"Claude batch request {result.type}")
@@ -1,10 +1,15 @@
 """Mock Claude connector for testing and local development without API calls."""
 
+from collections.abc import AsyncIterator
 from typing import Any
 
+import orjson
+
+from job_posting_extractor.exceptions import ExtractionError
 from job_posting_extractor.models import (
     EmploymentType,
     ExperienceLevel,
+    JobFieldEvent,
     JobPosting,
     RawExtractionResult,
     SalaryRange,
@@ -76,6 +81,8 @@ MOCK_RAW_RESPONSE = """{
 class MockClaudeConnector:
     """Mock connector for testing and local development without API calls."""
 
+    model = "mock-model"
+
     async def initialize(self) -> None:
         """No-op initialization for mock connector."""
 
@@ -88,9 +95,23 @@ class MockClaudeConnector:
 
     async def extract_job_posting(self, _job_text: str) -> RawExtractionResult:
         """Return mock job posting data."""
-        return RawExtractionResult(
+        return RawExtractionResult.model_construct(
             job=MOCK_JOB_POSTING,
             raw_response=MOCK_RAW_RESPONSE,
-            model="mock-model",
-            usage=UsageInfo(input_tokens=100, output_tokens=200),
+            model=self.model,
+            usage=UsageInfo.model_construct(input_tokens=100, output_tokens=200),
         )
+
+    async def stream_job_posting(
+        self, job_text: str
+    ) -> AsyncIterator[JobFieldEvent | RawExtractionResult]:
+        """Stream the mock job posting field by field, then the full result."""
+        for name, value in orjson.loads(MOCK_RAW_RESPONSE).items():
+            yield JobFieldEvent(field=name, value=value)
+        yield await self.extract_job_posting(job_text)
+
+    async def extract_job_postings_batch(
+        self, job_texts: list[str]
+    ) -> list[RawExtractionResult | ExtractionError]:
+        """Return mock job posting data for every text in the batch."""
+        return [await self.extract_job_posting(job_text) for job_text in job_texts]
@@ -5,6 +5,7 @@ import logging
 from typing import Any, Never, Self
 
 import httpx
+import orjson
 from openai import APIConnectionError, APIStatusError, AsyncOpenAI
 from pydantic import ValidationError
 from tenacity import (
@@ -21,12 +22,12 @@ from job_posting_extractor.connectors.shared import (
     EXTRACTION_SYSTEM_PROMPT,
     JOB_EXTRACTION_PROPERTIES,
     JOB_EXTRACTION_REQUIRED_FIELDS,
+    JOB_POSTING_ADAPTER,
     RETRYABLE_STATUS_CODES,
     validate_message,
 )
 from job_posting_extractor.exceptions import ExtractionError
 from job_posting_extractor.models import (
-    JobPosting,
     RawExtractionResult,
     UsageInfo,
 )
@@ -125,8 +126,15 @@ class OpenAICompatConnector:
             api_key=settings.openai_api_key.get_secret_value(),
             base_url=settings.openai_base_url,
             timeout=httpx.Timeout(settings.api_timeout, connect=10.0),
+            # Retries are handled by tenacity; SDK retries would multiply them
+            max_retries=0,
         )
 
+    @property
+    def model(self) -> str:
+        """Model used for extractions on the OpenAI-compatible server."""
+        return self.settings.openai_model
+
     async def initialize(self) -> None:
         """Initialize connector resources. No-op as client is created in __init__."""
 
@@ -260,16 +268,18 @@ class OpenAICompatConnector:
     ) -> RawExtractionResult:
         """Build a RawExtractionResult from parsed job data and API response."""
         try:
-            job = JobPosting(**job_data)
+            job = JOB_POSTING_ADAPTER.validate_python(job_data)
         except ValidationError as e:
             raise ExtractionError(f"Invalid job data structure: {e}") from e
 
+        # The job was validated above and the rest comes from the SDK
+        # response, so the wrappers can skip revalidation
         usage = response.usage
-        return RawExtractionResult(
+        return RawExtractionResult.model_construct(
             job=job,
-            raw_response=str(job_data),
+            raw_response=orjson.dumps(job_data).decode(),
             model=response.model,
-            usage=UsageInfo(
+            usage=UsageInfo.model_construct(
                 input_tokens=usage.prompt_tokens if usage else 0,
                 output_tokens=usage.completion_tokens if usage else 0,
             ),
@@ -2,9 +2,12 @@
 
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from job_posting_extractor.exceptions import ExtractionError
+from job_posting_extractor.models import JobPosting
 
-RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+RETRYABLE_STATUS_CODES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
 
 EXTRACTION_SYSTEM_PROMPT = (
     "You are a structured data extraction tool. "
@@ -96,13 +99,17 @@ JOB_EXTRACTION_REQUIRED_FIELDS = ["job_title", "company"]
 
 ALL_JOB_FIELDS = list(JOB_EXTRACTION_PROPERTIES.keys())
 
+# Reused validator for untrusted tool/function-call output
+JOB_POSTING_ADAPTER: TypeAdapter[JobPosting] = TypeAdapter(JobPosting)
+
 
 def validate_message(message: str, max_chars: int = 50_000) -> None:
     """Validate message before API call.
 
     Cut off after 50000 characters to avoid using too many tokens.
     """
-    if not message or not message.strip():
+    # isspace() scans in place; strip() would copy up to max_chars characters
+    if not message or message.isspace():
         raise ExtractionError("Message cannot be empty")
 
     if len(message) > max_chars:
@@ -47,3 +47,14 @@ class ConfigurationError(BusinessError):
             error_code="CONFIGURATION_ERROR",
             status_code=500,
         )
+
+
+class RequestTooLargeError(BusinessError):
+    """Raised when a request body exceeds the configured size limit."""
+
+    def __init__(self, message: str) -> None:
+        super().__init__(
+            message=message,
+            error_code="REQUEST_TOO_LARGE",
+            status_code=413,
+        )
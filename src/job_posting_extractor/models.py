@@ -2,7 +2,7 @@
 
 from datetime import date
 from enum import StrEnum
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field, HttpUrl, field_validator
 
@@ -150,7 +150,7 @@ class JobExtractionRequest(BaseModel):
     @classmethod
     def text_must_not_be_whitespace(cls, v: str) -> str:
         """Validate that text contains non-whitespace characters."""
-        if not v.strip():
+        if not v or v.isspace():
             raise ValueError("Text cannot be empty or contain only whitespace")
         return v
 
@@ -163,3 +163,33 @@ class JobExtractionResponse(BaseModel):
     raw_response: str = Field(description="Raw Claude response for debugging")
     model: str = Field(description="Claude model used for extraction")
     usage: UsageInfo = Field(description="Token usage information")
+
+
+class ExtractionErrorDetail(BaseModel):
+    """Error details for a posting that failed within a multi-posting request."""
+
+    detail: str = Field(description="Human-readable error message")
+    error_code: str = Field(description="Machine-readable error code")
+
+
+class JobExtractionItemResult(BaseModel):
+    """Result for one posting of a multi-posting extraction request."""
+
+    index: int = Field(description="Position of the posting in the request")
+    result: JobExtractionResponse | None = Field(
+        default=None, description="Extraction result if the posting succeeded"
+    )
+    error: ExtractionErrorDetail | None = Field(
+        default=None, description="Error details if the posting failed"
+    )
+
+
+class JobFieldEvent(BaseModel):
+    """A top-level job posting field, streamed as soon as it is complete.
+
+    Values are unvalidated previews; the final extraction result is
+    authoritative.
+    """
+
+    field: str = Field(description="Name of the JobPosting field")
+    value: Any = Field(description="Extracted value of the field")
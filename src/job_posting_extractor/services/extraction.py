@@ -2,21 +2,65 @@
 
 This service layer handles business logic for job extraction, including:
 - Confidence calculation based on extraction completeness
+- Concurrent, rate-limited extraction of many postings
+- Batch extraction for connectors that support it
+- Optional micro-batching of single extractions
+- Streaming extraction for connectors that support it
+- In-process caching of extraction responses, exact and semantic
+- Optional SQLite cache shared across workers and restarts
 
 Next TODOs/ideas:
 - TODO: Add PII filter logic
 
 - TODO: Add structured logging
-- TODO: Add response caching with Redis
 
 - TODO: Database persistence for extracted jobs
-- TODO: Batch extraction support
 - TODO: Extraction analytics and metrics
 - TODO: FE Plugin?
 """
 
-from job_posting_extractor.connectors.base import JobExtractor
-from job_posting_extractor.models import Confidence, JobExtractionResponse, JobPosting
+import hashlib
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from functools import partial
+from typing import TYPE_CHECKING
+
+import cachetools
+import orjson
+
+from job_posting_extractor.connectors.base import (
+    BatchJobExtractor,
+    JobExtractor,
+    StreamingJobExtractor,
+)
+from job_posting_extractor.connectors.shared import (
+    EXTRACTION_PROMPT,
+    JOB_EXTRACTION_PROPERTIES,
+    validate_message,
+)
+from job_posting_extractor.exceptions import ConfigurationError, ExtractionError
+from job_posting_extractor.models import (
+    Confidence,
+    JobExtractionResponse,
+    JobFieldEvent,
+    JobPosting,
+    RawExtractionResult,
+    UsageInfo,
+)
+from job_posting_extractor.services.parallel import (
+    AsyncLimiter,
+    MicroBatcher,
+    estimate_tokens,
+    extract_jobs_concurrent,
+)
+
+if TYPE_CHECKING:
+    # Optional extras; only imported by the app when the caches are enabled
+    from job_posting_extractor.services.persistent_cache import ExtractionCache
+    from job_posting_extractor.services.semantic_cache import SemanticCache, Vector
+
+# Reported for cache hits, which spend no tokens
+_NO_USAGE = UsageInfo(input_tokens=0, output_tokens=0)
 
 
 class ExtractionService:
@@ -26,8 +70,50 @@ class ExtractionService:
     to raw extraction results.
     """
 
-    def __init__(self, connector: JobExtractor) -> None:
+    def __init__(
+        self,
+        connector: JobExtractor,
+        limiter: AsyncLimiter | None = None,
+        max_concurrency: int = 10,
+        batcher: MicroBatcher | None = None,
+        cache_size: int = 0,
+        cache_ttl: float = 3600,
+        semantic_cache: "SemanticCache | None" = None,
+        persistent_cache: "ExtractionCache | None" = None,
+        cache_namespace: str = "",
+    ) -> None:
         self._connector = connector
+        self._limiter = limiter
+        self._max_concurrency = max_concurrency
+        self._batcher = batcher
+        # Responses for recently extracted texts; 0 disables caching
+        self._cache: cachetools.TTLCache[bytes, JobExtractionResponse] | None = (
+            cachetools.TTLCache(maxsize=cache_size, ttl=cache_ttl)
+            if cache_size > 0
+            else None
+        )
+        self._semantic_cache = semantic_cache
+        self._persistent_cache = persistent_cache
+        # Results differ per prompt, output schema and extraction settings
+        # (the namespace), so those are hashed once and copied for every key
+        self._key_prefix = hashlib.blake2b(digest_size=16)
+        for part in (
+            EXTRACTION_PROMPT.encode(),
+            orjson.dumps(JOB_EXTRACTION_PROPERTIES, option=orjson.OPT_SORT_KEYS),
+            cache_namespace.encode(),
+        ):
+            self._key_prefix.update(part + b"\0")
+        # Optional connector capabilities, resolved once rather than per request
+        self._stream_job_posting = (
+            connector.stream_job_posting
+            if isinstance(connector, StreamingJobExtractor)
+            else None
+        )
+        self._extract_job_postings_batch = (
+            connector.extract_job_postings_batch
+            if isinstance(connector, BatchJobExtractor)
+            else None
+        )
 
     async def cleanup(self) -> None:
         """Cleanup service resources."""
@@ -36,16 +122,239 @@ class ExtractionService:
     async def extract_job(self, job_text: str) -> JobExtractionResponse:
         """Extract structured job posting data from unstructured text.
 
+        Repeated texts are served from the response cache (in-process, then
+        persistent), and near-duplicate texts from the semantic cache, when
+        enabled. Cached responses report zero token usage.
+
         Args:
             job_text: Raw job posting text to parse.
 
         Returns:
             JobExtractionResponse with extracted data and confidence score.
         """
-        result = await self._connector.extract_job_posting(job_text)
+        key = self._cache_key(job_text)
+        if (cached := await self._get_cached(key)) is not None:
+            return cached
+
+        vector, similar = await self._get_similar(job_text)
+        if similar is not None:
+            return similar
+
+        if self._batcher is not None:
+            # Validate up front so one bad text can't fail a shared batch
+            validate_message(job_text)
+            result = await self._batcher.submit(job_text)
+        else:
+            async with self._rate_limit(job_text):
+                result = await self._connector.extract_job_posting(job_text)
+        response = self._build_response(result)
+
+        await self._store(key, response)
+        self._store_similar(vector, response)
+        return response
+
+    def stream_extract(
+        self, job_text: str
+    ) -> AsyncIterator[JobFieldEvent | JobExtractionResponse]:
+        """Stream job posting fields as they are extracted.
+
+        The text is validated before the stream is returned, so invalid input
+        raises immediately rather than partway through a response. Cached
+        and near-duplicate texts, and connectors without streaming support,
+        yield only the final response.
+
+        Args:
+            job_text: Raw job posting text to parse.
+
+        Returns:
+            Async iterator of JobFieldEvent per completed field, ending with
+            the JobExtractionResponse.
+
+        Raises:
+            ExtractionError: If the text is invalid.
+        """
+        validate_message(job_text)
+        return self._stream_extract(job_text)
+
+    async def _stream_extract(
+        self, job_text: str
+    ) -> AsyncIterator[JobFieldEvent | JobExtractionResponse]:
+        if self._stream_job_posting is None:
+            yield await self.extract_job(job_text)
+            return
+
+        key = self._cache_key(job_text)
+        if (cached := await self._get_cached(key)) is not None:
+            yield cached
+            return
+        vector, similar = await self._get_similar(job_text)
+        if similar is not None:
+            yield similar
+            return
+
+        async with self._rate_limit(job_text):
+            async for event in self._stream_job_posting(job_text):
+                if isinstance(event, JobFieldEvent):
+                    yield event
+                    continue
+                response = self._build_response(event)
+                await self._store(key, response)
+                self._store_similar(vector, response)
+                yield response
+
+    def _rate_limit(self, job_text: str) -> AbstractAsyncContextManager[None]:
+        """Wait for rate limit capacity for one direct connector request.
+
+        Batch requests are not limited here; the batch API has its own quota.
+        """
+        if self._limiter is None:
+            return nullcontext()
+        return self._limiter(estimated_tokens=estimate_tokens(job_text))
+
+    def _cache_key(self, job_text: str) -> bytes:
+        """Build the cache key for a text; results also differ per model."""
+        digest = self._key_prefix.copy()
+        digest.update(self._connector.model.encode() + b"\0")
+        digest.update(job_text.encode())
+        return digest.digest()
+
+    async def _get_cached(self, key: bytes) -> JobExtractionResponse | None:
+        """Look up a response in the in-process, then the persistent cache."""
+        if self._cache is not None and (cached := self._cache.get(key)) is not None:
+            return self._as_cache_hit(cached)
+        if self._persistent_cache is None:
+            return None
+        cached = await self._persistent_cache.get(key, self._connector.model)
+        if cached is None:
+            return None
+        if self._cache is not None:
+            self._cache[key] = cached
+        return self._as_cache_hit(cached)
+
+    async def _store(self, key: bytes, response: JobExtractionResponse) -> None:
+        """Cache a response in every enabled exact-match cache."""
+        if self._cache is not None:
+            self._cache[key] = response
+        if self._persistent_cache is not None:
+            await self._persistent_cache.put(key, self._connector.model, response)
+
+    async def _get_similar(
+        self, job_text: str
+    ) -> tuple["Vector | None", JobExtractionResponse | None]:
+        """Embed a text and look up a near-duplicate in the semantic cache.
+
+        Returns the embedding (None if the text isn't semantically cached)
+        for storing the eventual response, and the cached response, if any.
+        """
+        if self._semantic_cache is None:
+            return None, None
+        vector = await self._semantic_cache.embed(job_text)
+        if vector is None:
+            return None, None
+        similar = self._semantic_cache.get(self._connector.model, vector)
+        return vector, self._as_cache_hit(similar) if similar is not None else None
+
+    @staticmethod
+    def _as_cache_hit(response: JobExtractionResponse) -> JobExtractionResponse:
+        """Copy a cached response with zero usage, since no tokens were spent."""
+        return response.model_copy(update={"usage": _NO_USAGE})
+
+    def _store_similar(
+        self, vector: "Vector | None", response: JobExtractionResponse
+    ) -> None:
+        """Cache a response in the semantic cache under its text's embedding."""
+        if self._semantic_cache is not None and vector is not None:
+            self._semantic_cache.put(self._connector.model, vector, response)
+
+    async def extract_jobs(
+        self, job_texts: list[str]
+    ) -> list[JobExtractionResponse | ExtractionError]:
+        """Extract many job postings concurrently.
+
+        Extractions run in parallel, bounded by the configured concurrency
+        and rate limits. Cached and repeated texts are only extracted once.
+
+        Args:
+            job_texts: Raw job posting texts to parse.
+
+        Returns:
+            One entry per input text, in input order: a JobExtractionResponse
+            on success, or the ExtractionError for that posting.
+        """
+        return await self._extract_many(
+            job_texts,
+            partial(
+                extract_jobs_concurrent,
+                self._connector,
+                max_concurrency=self._max_concurrency,
+                limiter=self._limiter,
+            ),
+        )
+
+    async def extract_jobs_batch(
+        self, job_texts: list[str]
+    ) -> list[JobExtractionResponse | ExtractionError]:
+        """Extract many job postings in one batch request.
+
+        Cached and repeated texts are left out of the batch.
+
+        Args:
+            job_texts: Raw job posting texts to parse.
+
+        Returns:
+            One entry per input text, in input order: a JobExtractionResponse
+            on success, or the ExtractionError for that posting.
+
+        Raises:
+            ConfigurationError: If the connector doesn't support batching.
+        """
+        if self._extract_job_postings_batch is None:
+            raise ConfigurationError(
+                "The configured LLM provider does not support batch extraction"
+            )
+
+        return await self._extract_many(job_texts, self._extract_job_postings_batch)
+
+    async def _extract_many(
+        self,
+        job_texts: list[str],
+        extract: Callable[
+            [list[str]], Awaitable[list[RawExtractionResult | ExtractionError]]
+        ],
+    ) -> list[JobExtractionResponse | ExtractionError]:
+        """Extract the unique, uncached texts and fan results back out by index.
+
+        Successful results are built into responses and cached; errors are
+        kept as-is.
+        """
+        keys = [self._cache_key(job_text) for job_text in job_texts]
+        responses: dict[bytes, JobExtractionResponse | ExtractionError] = {}
+        pending: dict[bytes, str] = {}
+        for key, job_text in zip(keys, job_texts, strict=True):
+            if key in responses or key in pending:
+                continue
+            if (cached := await self._get_cached(key)) is not None:
+                responses[key] = cached
+            else:
+                pending[key] = job_text
+
+        if pending:
+            results = await extract(list(pending.values()))
+            for key, result in zip(pending, results, strict=True):
+                if isinstance(result, ExtractionError):
+                    responses[key] = result
+                    continue
+                responses[key] = response = self._build_response(result)
+                await self._store(key, response)
+
+        return [responses[key] for key in keys]
+
+    def _build_response(self, result: RawExtractionResult) -> JobExtractionResponse:
+        """Apply business logic to a raw extraction result."""
         confidence = self._calculate_confidence(result.job)
 
-        response = JobExtractionResponse(
+        # Every field comes from an already-validated result
+        response = JobExtractionResponse.model_construct(
             job=result.job,
             confidence=confidence,
             raw_response=result.raw_response,
@@ -55,7 +364,8 @@ class ExtractionService:
 
         return response
 
-    def _calculate_confidence(self, job: JobPosting) -> Confidence:
+    @staticmethod
+    def _calculate_confidence(job: JobPosting) -> Confidence:
         """Calculate confidence based on optional field completeness.
 
         Since job_title and company are required, we measure extraction
@@ -64,18 +374,20 @@ class ExtractionService:
         - medium: 3-5 optional fields present
         - low: 0-2 optional fields present
         """
-        optional_fields_present = sum(
-            [
-                job.location is not None,
-                job.work_location is not None,
-                job.employment_type is not None,
-                job.experience_level is not None,
-                job.salary is not None,
-                len(job.requirements) > 0,
-                len(job.nice_to_have) > 0,
-                len(job.responsibilities) > 0,
-                len(job.benefits) > 0,
-            ]
+        # Plain bool addition measured faster than a bitmask and table lookup
+        optional_fields_present = (
+            (job.location is not None)
+            + (job.work_location is not None)
+            + (job.employment_type is not None)
+            + (job.experience_level is not None)
+            + (job.salary is not None)
+            + bool(job.requirements)
+        )
+        # Six present fields already decide "high"; skip the remaining checks
+        if optional_fields_present >= 6:
+            return "high"
+        optional_fields_present += (
+            bool(job.nice_to_have) + bool(job.responsibilities) + bool(job.benefits)
         )
 
         if optional_fields_present >= 6:
@@ -0,0 +1,221 @@
+"""Concurrent extraction helpers with client-side rate limiting.
+
+Anthropic enforces per-key limits on requests per minute (RPM) and input
+tokens per minute (TPM). Fanning out many extractions at once without a
+limiter just turns latency into 429s, so concurrent extraction is bounded
+by a semaphore and a token-bucket limiter covering both limits.
+
+MicroBatcher goes the other way: it collects single extractions arriving
+close together and hands them to a batch handler in one call.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager, nullcontext, suppress
+from time import monotonic
+
+from job_posting_extractor.connectors.base import JobExtractor
+from job_posting_extractor.exceptions import ExtractionError
+from job_posting_extractor.models import RawExtractionResult
+
+
+class AsyncLimiter:
+    """Token-bucket rate limiter for requests and tokens per minute.
+
+    Both buckets start full and refill continuously at rpm/60 and tpm/60
+    units per second. Waiters are served in FIFO order.
+    """
+
+    def __init__(self, rpm: int, tpm: int) -> None:
+        self._rpm = rpm
+        self._tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._updated_at = monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._requests = min(self._rpm, self._requests + elapsed * self._rpm / 60)
+        self._tokens = min(self._tpm, self._tokens + elapsed * self._tpm / 60)
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until one request and `tokens` tokens are available."""
+        # A single request larger than the bucket would otherwise wait forever
+        tokens = min(tokens, self._tpm)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._requests >= 1 and self._tokens >= tokens:
+                    self._requests -= 1
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep(
+                    max(
+                        (1 - self._requests) * 60 / self._rpm,
+                        (tokens - self._tokens) * 60 / self._tpm,
+                    )
+                )
+
+    @asynccontextmanager
+    async def __call__(self, estimated_tokens: int = 0) -> AsyncIterator[None]:
+        """Acquire capacity for one request as an async context manager."""
+        await self.acquire(estimated_tokens)
+        yield
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the token count of a text (~4 characters per token)."""
+    return len(text) // 4
+
+
+async def extract_jobs_concurrent(
+    connector: JobExtractor,
+    job_texts: list[str],
+    *,
+    max_concurrency: int,
+    limiter: AsyncLimiter | None = None,
+) -> list[RawExtractionResult | ExtractionError]:
+    """Extract many job postings concurrently.
+
+    Args:
+        connector: Connector used for each individual extraction.
+        job_texts: Raw job posting texts to parse.
+        max_concurrency: Maximum number of extractions in flight at once.
+        limiter: Optional rate limiter shared across all callers.
+
+    Returns:
+        One entry per input text, in input order: a RawExtractionResult on
+        success, or an ExtractionError if that posting failed.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def extract(job_text: str) -> RawExtractionResult | ExtractionError:
+        rate_limit = (
+            limiter(estimated_tokens=estimate_tokens(job_text))
+            if limiter is not None
+            else nullcontext()
+        )
+        async with semaphore, rate_limit:
+            try:
+                return await connector.extract_job_posting(job_text)
+            except ExtractionError as e:
+                return e
+            except Exception as e:
+                return ExtractionError(f"Error extracting job posting: {e}")
+
+    return list(await asyncio.gather(*(extract(text) for text in job_texts)))
+
+
+BatchHandler = Callable[
+    [list[str]], Awaitable[list[RawExtractionResult | ExtractionError]]
+]
+
+
+class MicroBatcher:
+    """Group single extractions into batches before sending them upstream.
+
+    Submitted texts are collected until `max_size` are waiting or `window`
+    seconds have passed since the first one, then passed to `handler` in a
+    single call. Each submitter gets back the result for its own text.
+    """
+
+    def __init__(self, handler: BatchHandler, *, max_size: int, window: float) -> None:
+        self._handler = handler
+        self._max_size = max_size
+        self._window = window
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future[RawExtractionResult]]] = (
+            asyncio.Queue()
+        )
+        self._collector: asyncio.Task[None] | None = None
+        self._dispatches: set[asyncio.Task[None]] = set()
+
+    def start(self) -> None:
+        """Start collecting submissions in the background."""
+        if self._collector is None:
+            self._collector = asyncio.create_task(self._collect())
+
+    async def stop(self) -> None:
+        """Stop collecting and cancel any outstanding submissions."""
+        tasks = [*self._dispatches]
+        if self._collector is not None:
+            tasks.append(self._collector)
+            self._collector = None
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+
+    async def submit(self, job_text: str) -> RawExtractionResult:
+        """Queue a text for the next batch and wait for its result.
+
+        Raises:
+            ExtractionError: If extraction of this text failed.
+        """
+        future: asyncio.Future[RawExtractionResult] = (
+            asyncio.get_running_loop().create_future()
+        )
+        await self._queue.put((job_text, future))
+        return await future
+
+    async def _collect(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._window
+            try:
+                while len(batch) < self._max_size:
+                    try:
+                        batch.append(
+                            await asyncio.wait_for(
+                                self._queue.get(), timeout=deadline - loop.time()
+                            )
+                        )
+                    except TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # These are off the queue, so stop() can't cancel them
+                for _, future in batch:
+                    future.cancel()
+                raise
+            # Dispatch in the background so the next batch can start filling
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(
+        self, batch: list[tuple[str, asyncio.Future[RawExtractionResult]]]
+    ) -> None:
+        try:
+            results = await self._handler([job_text for job_text, _ in batch])
+            if len(results) != len(batch):
+                raise ExtractionError(
+                    f"Batch handler returned {len(results)} results "
+                    f"for {len(batch)} postings"
+                )
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            error = (
+                e
+                if isinstance(e, ExtractionError)
+                else ExtractionError(f"Error extracting job posting: {e}")
+            )
+            results = [error] * len(batch)
+
+        for (_, future), result in zip(batch, results, strict=True):
+            # The submitter may have been cancelled (e.g. client disconnected)
+            if future.done():
+                continue
+            if isinstance(result, ExtractionError):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,113 @@
+"""SQLite-backed extraction cache shared across workers and restarts.
+
+The in-process caches are per worker and empty after every restart. This
+cache keeps extraction responses in a SQLite database in WAL mode, so every
+uvicorn worker reads the same entries concurrently while writes are
+serialized by SQLite.
+
+Requires the optional `sqlite` extra (aiosqlite).
+"""
+
+import logging
+import sqlite3
+from contextlib import suppress
+from time import time
+from typing import TYPE_CHECKING
+
+from job_posting_extractor.exceptions import ConfigurationError
+from job_posting_extractor.models import JobExtractionResponse
+
+if TYPE_CHECKING:
+    import aiosqlite
+
+logger = logging.getLogger(__name__)
+
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS extraction_cache (
+    key BLOB PRIMARY KEY,
+    response_json BLOB NOT NULL,
+    model TEXT NOT NULL,
+    created_at REAL NOT NULL
+)
+"""
+
+
+class ExtractionCache:
+    """Persist extraction responses in SQLite, keyed by text digest and model.
+
+    Entries older than `ttl` seconds are ignored on lookup and removed when
+    the cache is opened. Timestamps are wall-clock, since they are shared
+    between processes. Database errors after opening (e.g. a locked or full
+    database) are logged and treated as a miss or a skipped store, so the
+    cache never fails an extraction.
+    """
+
+    def __init__(self, path: str, *, ttl: float = 3600) -> None:
+        self._path = path
+        self._ttl = ttl
+        self._db: aiosqlite.Connection | None = None
+
+    async def open(self) -> None:
+        """Open the database, creating the table if needed."""
+        try:
+            import aiosqlite
+        except ImportError as e:
+            raise ConfigurationError(
+                "The persistent cache requires the 'sqlite' extra "
+                "(pip install 'job-posting-extractor[sqlite]')"
+            ) from e
+        self._db = await aiosqlite.connect(self._path)
+        for pragma in _PRAGMAS:
+            await self._db.execute(pragma)
+        await self._db.execute(_SCHEMA)
+        await self._db.execute(
+            "DELETE FROM extraction_cache WHERE created_at <= ?", (time() - self._ttl,)
+        )
+        await self._db.commit()
+
+    async def close(self) -> None:
+        """Close the database connection."""
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
+
+    async def get(self, key: bytes, model: str) -> JobExtractionResponse | None:
+        """Return the cached response for a key, if present and not expired."""
+        try:
+            async with self._connection.execute(
+                "SELECT response_json FROM extraction_cache "
+                "WHERE key = ? AND model = ? AND created_at > ?",
+                (key, model, time() - self._ttl),
+            ) as cursor:
+                row = await cursor.fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Persistent cache lookup failed: %s", e)
+            return None
+        return JobExtractionResponse.model_validate_json(row[0]) if row else None
+
+    async def put(
+        self, key: bytes, model: str, response: JobExtractionResponse
+    ) -> None:
+        """Cache a response, replacing any existing entry for the key."""
+        try:
+            await self._connection.execute(
+                "INSERT OR REPLACE INTO extraction_cache VALUES (?, ?, ?, ?)",
+                (key, response.model_dump_json().encode(), model, time()),
+            )
+            await self._connection.commit()
+        except sqlite3.Error as e:
+            logger.warning("Persistent cache store failed: %s", e)
+            with suppress(sqlite3.Error):
+                await self._connection.rollback()
+
+    @property
+    def _connection(self) -> "aiosqlite.Connection":
+        if self._db is None:
+            raise RuntimeError("ExtractionCache is not open")
+        return self._db
@@ -0,0 +1,158 @@
+"""Semantic cache for near-duplicate job postings.
+
+Job postings are often reposted with trivial edits (whitespace, recruiter
+boilerplate, a changed date), which defeats an exact-match cache. This cache
+embeds the posting text and serves a cached response when a previous
+posting for the same model is close enough by cosine similarity.
+
+Requires the optional `semantic` extra (fastembed and numpy).
+"""
+
+import asyncio
+from collections.abc import Sequence
+from time import monotonic
+from typing import Protocol
+
+import numpy as np
+import numpy.typing as npt
+
+from job_posting_extractor.exceptions import ConfigurationError
+from job_posting_extractor.models import JobExtractionResponse
+
+Vector = npt.NDArray[np.float32]
+
+
+class Embedder(Protocol):
+    """Turns text into a dense embedding vector."""
+
+    def embed(self, text: str) -> Sequence[float]:
+        """Embed a single text."""
+        ...
+
+
+class FastEmbedEmbedder:
+    """Local ONNX sentence embeddings via fastembed."""
+
+    def __init__(self, model_name: str) -> None:
+        try:
+            from fastembed import TextEmbedding
+        except ImportError as e:
+            raise ConfigurationError(
+                "Semantic caching requires the 'semantic' extra "
+                "(pip install 'job-posting-extractor[semantic]')"
+            ) from e
+        self._model = TextEmbedding(model_name)
+
+    def embed(self, text: str) -> Sequence[float]:
+        """Embed a single text."""
+        embedding: Sequence[float] = next(iter(self._model.embed([text])))
+        return embedding
+
+
+class _VectorIndex:
+    """Brute-force cosine index over normalized vectors with expiry.
+
+    Rows live in preallocated arrays that double in size up to
+    `max_entries`; once full, the oldest row is overwritten.
+    """
+
+    _INITIAL_CAPACITY = 16
+
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._vectors: Vector | None = None
+        self._expires_at: npt.NDArray[np.float64] = np.empty(0)
+        self._responses: list[JobExtractionResponse] = []
+        # Row to overwrite next once the index is full
+        self._oldest = 0
+
+    def search(self, vector: Vector, threshold: float) -> JobExtractionResponse | None:
+        size = len(self._responses)
+        if self._vectors is None or not size:
+            return None
+        scores = self._vectors[:size] @ vector
+        scores[self._expires_at[:size] <= monotonic()] = -np.inf
+        best = int(np.argmax(scores))
+        return self._responses[best] if scores[best] >= threshold else None
+
+    def add(self, vector: Vector, response: JobExtractionResponse) -> None:
+        size = len(self._responses)
+        if size < self._max_entries:
+            vectors = self._vectors
+            if vectors is None or size == len(vectors):
+                vectors = self._grow(size, len(vector))
+            row = size
+            self._responses.append(response)
+        else:
+            assert self._vectors is not None
+            vectors = self._vectors
+            # Oldest entries are evicted first
+            row = self._oldest
+            self._oldest = (row + 1) % self._max_entries
+            self._responses[row] = response
+        vectors[row] = vector
+        self._expires_at[row] = monotonic() + self._ttl
+
+    def _grow(self, size: int, dimensions: int) -> Vector:
+        """Reallocate the arrays with double the capacity, keeping `size` rows."""
+        capacity = min(max(2 * size, self._INITIAL_CAPACITY), self._max_entries)
+        vectors = np.empty((capacity, dimensions), dtype=np.float32)
+        expires_at = np.empty(capacity)
+        if self._vectors is not None:
+            vectors[:size] = self._vectors[:size]
+            expires_at[:size] = self._expires_at[:size]
+        self._vectors = vectors
+        self._expires_at = expires_at
+        return vectors
+
+
+class SemanticCache:
+    """Cache extraction responses by embedding similarity of the posting text.
+
+    Entries are namespaced (e.g. by model) so results from one model are
+    never served for another. Texts shorter than `min_chars` are not cached,
+    since short inputs are too easily mistaken for one another.
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        *,
+        threshold: float = 0.95,
+        min_chars: int = 200,
+        max_entries: int = 1024,
+        ttl: float = 3600,
+    ) -> None:
+        self._embedder = embedder
+        self._threshold = threshold
+        self._min_chars = min_chars
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._indexes: dict[str, _VectorIndex] = {}
+
+    async def embed(self, text: str) -> Vector | None:
+        """Embed a text for lookup, or return None if it is too short to cache."""
+        if len(text) < self._min_chars:
+            return None
+        # Embedding is CPU-bound; keep it off the event loop
+        embedding = await asyncio.to_thread(self._embedder.embed, text)
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    def get(self, namespace: str, vector: Vector) -> JobExtractionResponse | None:
+        """Return the most similar cached response above the threshold."""
+        index = self._indexes.get(namespace)
+        return index.search(vector, self._threshold) if index is not None else None
+
+    def put(
+        self, namespace: str, vector: Vector, response: JobExtractionResponse
+    ) -> None:
+        """Cache a response under the given embedding."""
+        index = self._indexes.get(namespace)
+        if index is None:
+            index = self._indexes[namespace] = _VectorIndex(
+                self._max_entries, self._ttl
+            )
+        index.add(vector, response)
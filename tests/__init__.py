@@ -1,3 +1,53 @@
 """Test suite for job_posting_extractor."""
 
+from typing import Any
+
+import httpx
+from fastapi import FastAPI
+
+from job_posting_extractor.models import RawExtractionResult
+
 TEST_MODEL = "claude-sonnet-4-5-20250929"
+
+
+def async_client(app: FastAPI) -> httpx.AsyncClient:
+    """In-process async client for an ASGI app (lifespan not included)."""
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+
+
+class StubExtractor:
+    """Hand-rolled JobExtractor stub; far cheaper per call than AsyncMock.
+
+    Every extraction returns `result` and is recorded in `calls`. While
+    `outcomes` is non-empty, each call instead consumes its next entry,
+    raising it if it is an exception. `cleanup` raises `cleanup_error`
+    when one is set.
+    """
+
+    def __init__(self, result: RawExtractionResult) -> None:
+        self.model = TEST_MODEL
+        self.result = result
+        self.outcomes: list[RawExtractionResult | Exception] = []
+        self.calls: list[str] = []
+        self.cleaned_up = False
+        self.cleanup_error: Exception | None = None
+
+    async def initialize(self) -> None:
+        pass
+
+    async def cleanup(self) -> None:
+        if self.cleanup_error is not None:
+            raise self.cleanup_error
+        self.cleaned_up = True
+
+    async def health_check(self) -> dict[str, Any]:
+        return {"status": "healthy", "model": "mock"}
+
+    async def extract_job_posting(self, job_text: str) -> RawExtractionResult:
+        self.calls.append(job_text)
+        outcome = self.outcomes.pop(0) if self.outcomes else self.result
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
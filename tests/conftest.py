@@ -1,13 +1,15 @@
 """Shared test fixtures for job_posting_extractor tests."""
 
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import AsyncExitStack, contextmanager
 from datetime import date
-from typing import Any
-from unittest.mock import AsyncMock
 
+import httpx
 import pytest
-from fastapi.testclient import TestClient
+from fastapi import FastAPI
 
 from job_posting_extractor.api.service import create_app
+from job_posting_extractor.config import get_settings
 from job_posting_extractor.connectors.mock_claude import MockClaudeConnector
 from job_posting_extractor.models import (
     EmploymentType,
@@ -19,12 +21,16 @@ from job_posting_extractor.models import (
     WorkLocation,
 )
 from job_posting_extractor.services.extraction import ExtractionService
-from tests import TEST_MODEL
+from tests import TEST_MODEL, StubExtractor, async_client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_job_posting() -> JobPosting:
-    """A fully populated job posting for testing."""
+    """A fully populated job posting for testing.
+
+    Session-scoped like the other sample models below, so tests must treat
+    them as read-only.
+    """
     return JobPosting(
         job_title="Senior Python Developer",
         company="TechCorp",
@@ -46,7 +52,7 @@ def sample_job_posting() -> JobPosting:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_job_posting() -> JobPosting:
     """A job posting with only required fields."""
     return JobPosting(
@@ -55,22 +61,37 @@ def minimal_job_posting() -> JobPosting:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_usage_info() -> UsageInfo:
     """Sample token usage info."""
     return UsageInfo(input_tokens=150, output_tokens=300)
 
 
+@pytest.fixture(scope="session")
+def raw_result_factory(
+    sample_usage_info: UsageInfo,
+) -> Callable[..., RawExtractionResult]:
+    """Build unvalidated extraction results around a given job posting."""
+
+    def make(job: JobPosting, **overrides: object) -> RawExtractionResult:
+        fields = {
+            "raw_response": "{}",
+            "model": TEST_MODEL,
+            "usage": sample_usage_info,
+        }
+        return RawExtractionResult.model_construct(job=job, **fields | overrides)
+
+    return make
+
+
 @pytest.fixture
 def sample_raw_extraction_result(
-    sample_job_posting: JobPosting, sample_usage_info: UsageInfo
+    sample_job_posting: JobPosting,
+    raw_result_factory: Callable[..., RawExtractionResult],
 ) -> RawExtractionResult:
     """Sample raw extraction result."""
-    return RawExtractionResult(
-        job=sample_job_posting,
-        raw_response='{"job_title": "Senior Python Developer"}',
-        model=TEST_MODEL,
-        usage=sample_usage_info,
+    return raw_result_factory(
+        sample_job_posting, raw_response='{"job_title": "Senior Python Developer"}'
     )
 
 
@@ -87,37 +108,59 @@ def extraction_service(mock_connector: MockClaudeConnector) -> ExtractionService
 
 
 @pytest.fixture
-def mock_job_extractor(
+def stub_extractor(
     sample_raw_extraction_result: RawExtractionResult,
-) -> AsyncMock:
-    """A mock JobExtractor for unit testing."""
-    mock = AsyncMock()
-    mock.extract_job_posting.return_value = sample_raw_extraction_result
-    mock.initialize.return_value = None
-    mock.cleanup.return_value = None
-    mock.health_check.return_value = {"status": "healthy", "model": "mock"}
-    return mock
+) -> StubExtractor:
+    """A stub JobExtractor for unit testing."""
+    return StubExtractor(sample_raw_extraction_result)
 
 
 @pytest.fixture
-def app(monkeypatch: pytest.MonkeyPatch) -> Any:
-    """Create test application with mock LLM enabled."""
-    monkeypatch.setenv("MOCK_LLM", "true")
-    from job_posting_extractor.config import get_settings
+def service(stub_extractor: StubExtractor) -> ExtractionService:
+    """Extraction service bound to the stub extractor."""
+    return ExtractionService(connector=stub_extractor)
 
-    get_settings.cache_clear()
-    yield create_app()
-    get_settings.cache_clear()
 
+@contextmanager
+def _session_app_settings() -> Iterator[None]:
+    """Settings for the shared app: mock LLM and no response cache.
 
-@pytest.fixture
-def client(app: Any) -> TestClient:
-    """Test client for API integration tests with lifespan support."""
-    with TestClient(app) as test_client:
-        yield test_client
+    The environment is only patched while the app reads its settings, so
+    other tests still see the defaults. With the cache disabled, no test's
+    result depends on which texts earlier tests sent.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("MOCK_LLM", "true")
+        mp.setenv("EXTRACTION_CACHE_SIZE", "0")
+        get_settings.cache_clear()
+        try:
+            yield
+        finally:
+            get_settings.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    """Test application with mock LLM enabled, built once per session.
+
+    Tests that install dependency overrides must not leak them; test_api.py
+    clears them after every test.
+    """
+    with _session_app_settings():
+        return create_app()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+async def client(app: FastAPI) -> AsyncIterator[httpx.AsyncClient]:
+    """Async test client sharing one app lifespan across the session."""
+    async with AsyncExitStack() as stack:
+        # Startup reads the settings again to build the connector and service
+        with _session_app_settings():
+            await stack.enter_async_context(app.router.lifespan_context(app))
+        yield await stack.enter_async_context(async_client(app))
+
+
+@pytest.fixture(scope="session")
 def sample_job_text() -> str:
     """Sample job posting text for extraction tests."""
     return """
@@ -1,63 +1,81 @@
 """Integration tests for API endpoints."""
 
+import json
+from collections.abc import AsyncIterator, Iterator
 from typing import Any
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
+import httpx
+import orjson
 import pytest
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
 
 from job_posting_extractor import __version__
 from job_posting_extractor.api.dependencies import get_extraction_service
+from job_posting_extractor.api.routing import ORJSONRoute
+from job_posting_extractor.api.service import create_app
+from job_posting_extractor.config import get_settings
 from job_posting_extractor.exceptions import ExtractionError
 from job_posting_extractor.models import (
     JobExtractionResponse,
+    JobFieldEvent,
     JobPosting,
     UsageInfo,
 )
 from job_posting_extractor.services.extraction import ExtractionService
+from tests import async_client
+
+
+@pytest.fixture(autouse=True)
+def _clear_overrides(app: FastAPI) -> Iterator[None]:
+    """Keep dependency overrides from leaking into other tests' shared app."""
+    yield
+    app.dependency_overrides.clear()
 
 
 class TestHealthEndpoint:
     """Tests for /health endpoint."""
 
-    def test_health_check_returns_healthy(self, client: TestClient) -> None:
-        response = client.get("/health")
+    async def test_health_check_returns_healthy(
+        self, client: httpx.AsyncClient
+    ) -> None:
+        response = await client.get("/health")
         assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
         data = response.json()
         assert data["status"] == "healthy"
         assert data["version"] == __version__
 
 
+@pytest.fixture(scope="module")
+async def extract_response(
+    client: httpx.AsyncClient, sample_job_text: str
+) -> httpx.Response:
+    """One successful /extract/job response, shared by tests that only read it."""
+    return await client.post("/api/v1/extract/job", json={"text": sample_job_text})
+
+
 class TestExtractJobEndpoint:
     """Tests for POST /api/v1/extract/job endpoint."""
 
-    def test_extract_job_success(
-        self, client: TestClient, sample_job_text: str
-    ) -> None:
-        response = client.post("/api/v1/extract/job", json={"text": sample_job_text})
-
-        assert response.status_code == 200
-        data = response.json()
+    def test_extract_job_success(self, extract_response: httpx.Response) -> None:
+        assert extract_response.status_code == 200
+        data = extract_response.json()
         assert "job" in data
         assert "confidence" in data
         assert data["job"]["job_title"] == "Senior Python Developer"
         assert data["job"]["company"] == "TechCorp"
 
     def test_extract_job_returns_confidence(
-        self, client: TestClient, sample_job_text: str
+        self, extract_response: httpx.Response
     ) -> None:
-        response = client.post("/api/v1/extract/job", json={"text": sample_job_text})
-
-        data = response.json()
+        data = extract_response.json()
         assert data["confidence"] in ["high", "medium", "low"]
 
     def test_extract_job_returns_metadata(
-        self, client: TestClient, sample_job_text: str
+        self, extract_response: httpx.Response
     ) -> None:
-        response = client.post("/api/v1/extract/job", json={"text": sample_job_text})
-
-        data = response.json()
+        data = extract_response.json()
         assert "model" in data
         assert "usage" in data
         assert "raw_response" in data
@@ -72,16 +90,16 @@ class TestExtractJobEndpoint:
             pytest.param({}, id="missing_text"),
         ],
     )
-    def test_extract_job_invalid_requests(
+    async def test_extract_job_invalid_requests(
         self,
-        client: TestClient,
+        client: httpx.AsyncClient,
         payload: dict,
     ) -> None:
-        response = client.post("/api/v1/extract/job", json=payload)
+        response = await client.post("/api/v1/extract/job", json=payload)
         assert response.status_code == 422
 
-    def test_extract_job_invalid_json(self, client: TestClient) -> None:
-        response = client.post(
+    async def test_extract_job_invalid_json(self, client: httpx.AsyncClient) -> None:
+        response = await client.post(
             "/api/v1/extract/job",
             content="not json",
             headers={"Content-Type": "application/json"},
@@ -89,6 +107,195 @@ class TestExtractJobEndpoint:
         assert response.status_code == 422
 
 
+def _parse_sse(body: str) -> list[tuple[str, Any]]:
+    """Split an SSE body into (event, data) pairs."""
+    events = []
+    for message in body.strip().split("\n\n"):
+        event_line, data_line = message.split("\n")
+        events.append(
+            (event_line.removeprefix("event: "), json.loads(data_line[len("data: ") :]))
+        )
+    return events
+
+
+class TestStreamExtractJobEndpoint:
+    """Tests for POST /api/v1/extract/job/stream endpoint."""
+
+    async def test_stream_emits_fields_then_result(
+        self, client: httpx.AsyncClient, sample_job_text: str
+    ) -> None:
+        response = await client.post(
+            "/api/v1/extract/job/stream", json={"text": sample_job_text}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _parse_sse(response.text)
+        assert events[0] == (
+            "field",
+            {"field": "job_title", "value": "Senior Python Developer"},
+        )
+        assert {name for name, _ in events[:-1]} == {"field"}
+        name, result = events[-1]
+        assert name == "result"
+        assert result["job"]["company"] == "TechCorp"
+        assert result["confidence"] == "high"
+
+    async def test_invalid_text_returns_error_status(
+        self, client: httpx.AsyncClient
+    ) -> None:
+        response = await client.post("/api/v1/extract/job/stream", json={"text": "   "})
+
+        assert response.status_code == 422
+
+    async def test_failure_mid_stream_emits_error_event(
+        self, app: FastAPI, client: httpx.AsyncClient
+    ) -> None:
+        async def failing_stream() -> AsyncIterator[JobFieldEvent]:
+            yield JobFieldEvent(field="job_title", value="Developer")
+            raise ExtractionError("Claude did not return structured output")
+
+        mock_service = MagicMock(spec=ExtractionService)
+        mock_service.stream_extract.return_value = failing_stream()
+
+        def override_service() -> ExtractionService:
+            return mock_service  # type: ignore[return-value]
+
+        app.dependency_overrides[get_extraction_service] = override_service
+
+        response = await client.post(
+            "/api/v1/extract/job/stream", json={"text": "Some job posting"}
+        )
+
+        assert _parse_sse(response.text) == [
+            ("field", {"field": "job_title", "value": "Developer"}),
+            (
+                "error",
+                {
+                    "detail": "Claude did not return structured output",
+                    "error_code": "EXTRACTION_ERROR",
+                },
+            ),
+        ]
+
+    async def test_unexpected_failure_mid_stream_emits_error_event(
+        self,
+        app: FastAPI,
+        client: httpx.AsyncClient,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        async def failing_stream() -> AsyncIterator[JobFieldEvent]:
+            yield JobFieldEvent(field="job_title", value="Developer")
+            raise RuntimeError("connection reset")
+
+        mock_service = MagicMock(spec=ExtractionService)
+        mock_service.stream_extract.return_value = failing_stream()
+
+        def override_service() -> ExtractionService:
+            return mock_service  # type: ignore[return-value]
+
+        app.dependency_overrides[get_extraction_service] = override_service
+
+        response = await client.post(
+            "/api/v1/extract/job/stream", json={"text": "Some job posting"}
+        )
+
+        assert _parse_sse(response.text) == [
+            ("field", {"field": "job_title", "value": "Developer"}),
+            (
+                "error",
+                {"detail": "Internal server error", "error_code": "INTERNAL_ERROR"},
+            ),
+        ]
+        assert "connection reset" in caplog.text
+
+
+class TestExtractJobsParallelEndpoint:
+    """Tests for POST /api/v1/extract/jobs/parallel endpoint."""
+
+    async def test_extract_jobs_parallel_success(
+        self, client: httpx.AsyncClient, sample_job_text: str
+    ) -> None:
+        response = await client.post(
+            "/api/v1/extract/jobs/parallel",
+            json=[{"text": sample_job_text}, {"text": "Another posting"}],
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["index"] for item in data] == [0, 1]
+        assert all(item["error"] is None for item in data)
+        assert data[1]["result"]["job"]["company"] == "TechCorp"
+
+    async def test_extract_jobs_parallel_rejects_empty_list(
+        self, client: httpx.AsyncClient
+    ) -> None:
+        response = await client.post("/api/v1/extract/jobs/parallel", json=[])
+        assert response.status_code == 422
+
+
+class TestExtractJobsBatchEndpoint:
+    """Tests for POST /api/v1/extract/jobs/batch endpoint."""
+
+    async def test_extract_jobs_batch_success(
+        self, client: httpx.AsyncClient, sample_job_text: str
+    ) -> None:
+        response = await client.post(
+            "/api/v1/extract/jobs/batch",
+            json=[{"text": sample_job_text}, {"text": "Another posting"}],
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["index"] for item in data] == [0, 1]
+        assert all(item["error"] is None for item in data)
+        assert data[0]["result"]["job"]["job_title"] == "Senior Python Developer"
+        assert data[0]["result"]["confidence"] == "high"
+
+    async def test_extract_jobs_batch_reports_failed_items(
+        self, app: FastAPI, client: httpx.AsyncClient
+    ) -> None:
+        mock_service = AsyncMock(spec=ExtractionService)
+        mock_service.extract_jobs_batch.return_value = [
+            ExtractionError("Claude batch request expired")
+        ]
+
+        def override_service() -> ExtractionService:
+            return mock_service  # type: ignore[return-value]
+
+        app.dependency_overrides[get_extraction_service] = override_service
+
+        response = await client.post(
+            "/api/v1/extract/jobs/batch", json=[{"text": "Some job posting"}]
+        )
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {
+                "index": 0,
+                "result": None,
+                "error": {
+                    "detail": "Claude batch request expired",
+                    "error_code": "EXTRACTION_ERROR",
+                },
+            }
+        ]
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            pytest.param([], id="empty_list"),
+            pytest.param([{"text": ""}], id="empty_text"),
+            pytest.param({"text": "not a list"}, id="not_a_list"),
+        ],
+    )
+    async def test_extract_jobs_batch_invalid_requests(
+        self, client: httpx.AsyncClient, payload: Any
+    ) -> None:
+        response = await client.post("/api/v1/extract/jobs/batch", json=payload)
+        assert response.status_code == 422
+
+
 class TestExceptionHandlers:
     """Tests for custom exception handlers."""
 
@@ -106,13 +313,13 @@ class TestExceptionHandlers:
         app.dependency_overrides[get_extraction_service] = override_service
         return app
 
-    def test_extraction_error_returns_422(
-        self, app_with_failing_service: FastAPI
+    @pytest.mark.usefixtures("app_with_failing_service")
+    async def test_extraction_error_returns_422(
+        self, client: httpx.AsyncClient
     ) -> None:
-        with TestClient(app_with_failing_service) as client:
-            response = client.post(
-                "/api/v1/extract/job", json={"text": "Some job posting"}
-            )
+        response = await client.post(
+            "/api/v1/extract/job", json={"text": "Some job posting"}
+        )
 
         assert response.status_code == 422
         data = response.json()
@@ -120,6 +327,114 @@ class TestExceptionHandlers:
         assert data["detail"] == "Failed to extract job data"
 
 
+class TestMicroBatching:
+    """Tests for serving /extract/job through the micro-batcher."""
+
+    @pytest.fixture
+    def microbatching_app(self, monkeypatch: pytest.MonkeyPatch) -> Iterator[FastAPI]:
+        """A separate app, so the shared one keeps its settings."""
+        monkeypatch.setenv("MOCK_LLM", "true")
+        monkeypatch.setenv("ENABLE_MICROBATCHING", "true")
+        monkeypatch.setenv("BATCH_WINDOW_MS", "1")
+        get_settings.cache_clear()
+        yield create_app()
+        get_settings.cache_clear()
+
+    async def test_extract_job_with_microbatching(
+        self, microbatching_app: FastAPI, sample_job_text: str
+    ) -> None:
+        app = microbatching_app
+        async with app.router.lifespan_context(app), async_client(app) as client:
+            assert app.state.extraction_service._batcher is not None
+            response = await client.post(
+                "/api/v1/extract/job", json={"text": sample_job_text}
+            )
+
+        assert response.status_code == 200
+        assert response.json()["job"]["job_title"] == "Senior Python Developer"
+
+
+class TestRateLimits:
+    """Tests for how the rate limits are applied per worker."""
+
+    async def test_limits_are_split_between_workers(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("MOCK_LLM", "true")
+        monkeypatch.setenv("WORKERS", "2")
+        monkeypatch.setenv("RATE_LIMIT_RPM", "50")
+        monkeypatch.setenv("RATE_LIMIT_TPM", "30000")
+        get_settings.cache_clear()
+        app = create_app()
+        try:
+            async with app.router.lifespan_context(app):
+                limiter = app.state.extraction_service._limiter
+                assert (limiter._rpm, limiter._tpm) == (25, 15_000)
+        finally:
+            get_settings.cache_clear()
+
+
+class TestRequestSizeLimit:
+    """Tests for the request body size limit middleware."""
+
+    async def test_oversized_request_returns_413(
+        self, client: httpx.AsyncClient
+    ) -> None:
+        response = await client.post(
+            "/api/v1/extract/job", json={"text": "x" * 200_001}
+        )
+
+        assert response.status_code == 413
+        data = response.json()
+        assert data["error_code"] == "REQUEST_TOO_LARGE"
+        assert "200,000" in data["detail"]
+
+    async def test_request_within_limit_is_processed(
+        self, client: httpx.AsyncClient, sample_job_text: str
+    ) -> None:
+        response = await client.post(
+            "/api/v1/extract/job", json={"text": sample_job_text}
+        )
+
+        assert response.status_code == 200
+
+    async def test_oversized_chunked_request_returns_413(
+        self, client: httpx.AsyncClient
+    ) -> None:
+        async def chunks() -> AsyncIterator[bytes]:
+            yield b'{"text": "'
+            for _ in range(30):
+                yield b"x" * 10_000
+            yield b'"}'
+
+        response = await client.post(
+            "/api/v1/extract/job",
+            content=chunks(),
+            headers={"content-type": "application/json"},
+        )
+
+        assert "content-length" not in response.request.headers
+        assert response.status_code == 413
+        assert response.json()["error_code"] == "REQUEST_TOO_LARGE"
+
+    async def test_chunked_request_within_limit_is_processed(
+        self, client: httpx.AsyncClient, sample_job_text: str
+    ) -> None:
+        body = orjson.dumps({"text": sample_job_text})
+
+        async def chunks() -> AsyncIterator[bytes]:
+            yield body[:10]
+            yield body[10:]
+
+        response = await client.post(
+            "/api/v1/extract/job",
+            content=chunks(),
+            headers={"content-type": "application/json"},
+        )
+
+        assert response.status_code == 200
+
+
 class TestDependencyOverrides:
     """Tests demonstrating dependency injection for testing."""
 
@@ -136,9 +451,10 @@ class TestDependencyOverrides:
             usage=sample_usage_info,
         )
 
-    def test_override_extraction_service(
+    async def test_override_extraction_service(
         self,
         app: FastAPI,
+        client: httpx.AsyncClient,
         mock_extraction_response: JobExtractionResponse,
     ) -> None:
         """Demonstrate overriding the extraction service for isolated testing."""
@@ -150,8 +466,9 @@ class TestDependencyOverrides:
 
         app.dependency_overrides[get_extraction_service] = override_service
 
-        client = TestClient(app)
-        response = client.post("/api/v1/extract/job", json={"text": "Test posting"})
+        response = await client.post(
+            "/api/v1/extract/job", json={"text": "Test posting"}
+        )
 
         assert response.status_code == 200
         data = response.json()
@@ -166,11 +483,8 @@ class TestDependencyOverrides:
 class TestResponseStructure:
     """Tests verifying the complete response structure."""
 
-    def test_full_response_structure(
-        self, client: TestClient, sample_job_text: str
-    ) -> None:
-        response = client.post("/api/v1/extract/job", json={"text": sample_job_text})
-        data = response.json()
+    def test_full_response_structure(self, extract_response: httpx.Response) -> None:
+        data = extract_response.json()
 
         # Top-level fields
         assert set(data.keys()) == {
@@ -212,6 +526,15 @@ class TestAppFactory:
     def test_app_includes_extraction_router(self, app: Any) -> None:
         routes = [route.path for route in app.routes]
         assert "/api/v1/extract/job" in routes
+        assert "/api/v1/extract/jobs/parallel" in routes
+        assert "/api/v1/extract/jobs/batch" in routes
+
+    def test_extraction_routes_parse_json_with_orjson(self, app: Any) -> None:
+        extraction_routes = [
+            route for route in app.routes if route.path.startswith("/api/v1/")
+        ]
+        assert extraction_routes
+        assert all(isinstance(route, ORJSONRoute) for route in extraction_routes)
 
     def test_app_includes_health_endpoint(self, app: Any) -> None:
         routes = [route.path for route in app.routes]
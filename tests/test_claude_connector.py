@@ -1,18 +1,27 @@
 """Tests for ClaudeConnector."""
 
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import anthropic
+import httpx
 import pytest
+from anthropic.types import ToolUseBlock
 from pydantic import SecretStr
 
 from job_posting_extractor.config import Settings
 from job_posting_extractor.connectors.claude import (
+    _JOB_EXTRACTION_TOOL_MIN,
+    JOB_EXTRACTION_TOOL,
     ClaudeConnector,
     _is_retryable_error,
 )
 from job_posting_extractor.exceptions import ExtractionError
+from job_posting_extractor.models import JobFieldEvent, RawExtractionResult
 from tests import TEST_MODEL
 
 
@@ -24,6 +33,8 @@ def mock_settings() -> Settings:
         claude_model=TEST_MODEL,
         max_tokens=1024,
         mock_llm=False,
+        batch_poll_interval=0.0,
+        warmup_on_startup=False,
     )
 
 
@@ -104,6 +115,51 @@ class TestClaudeConnectorInit:
             connector = ClaudeConnector(mock_settings)
             assert connector.settings == mock_settings
 
+    def test_init_shares_pooled_http_client(self, mock_settings: Settings) -> None:
+        with patch(
+            "job_posting_extractor.connectors.claude.anthropic.AsyncAnthropic"
+        ) as mock_anthropic:
+            connector = ClaudeConnector(mock_settings)
+
+        assert mock_anthropic.call_args.kwargs["http_client"] is connector._http
+
+    def test_init_disables_sdk_retries(self, mock_settings: Settings) -> None:
+        with patch(
+            "job_posting_extractor.connectors.claude.anthropic.AsyncAnthropic"
+        ) as mock_anthropic:
+            ClaudeConnector(mock_settings)
+
+        # tenacity owns retries; SDK retries would multiply the attempts
+        assert mock_anthropic.call_args.kwargs["max_retries"] == 0
+
+
+class TestMinimalToolSchema:
+    """Tests for the description-free tool schema."""
+
+    def test_minimal_schema_has_no_field_descriptions(self) -> None:
+        assert "description" not in str(_JOB_EXTRACTION_TOOL_MIN["input_schema"])
+
+    def test_minimal_schema_keeps_fields_and_constraints(self) -> None:
+        full = JOB_EXTRACTION_TOOL["input_schema"]
+        minimal = _JOB_EXTRACTION_TOOL_MIN["input_schema"]
+        assert minimal["required"] == full["required"]
+        assert minimal["properties"].keys() == full["properties"].keys()
+        assert (
+            minimal["properties"]["work_location"]["enum"]
+            == full["properties"]["work_location"]["enum"]
+        )
+
+    @pytest.mark.parametrize("use_minimal", [False, True])
+    def test_setting_selects_tool_schema(
+        self, mock_settings: Settings, use_minimal: bool
+    ) -> None:
+        mock_settings.use_minimal_tool_schema = use_minimal
+        with patch("job_posting_extractor.connectors.claude.anthropic.AsyncAnthropic"):
+            connector = ClaudeConnector(mock_settings)
+
+        expected = _JOB_EXTRACTION_TOOL_MIN if use_minimal else JOB_EXTRACTION_TOOL
+        assert connector._extraction_params("text")["tools"] == [expected]
+
 
 class TestClaudeConnectorMessageValidation:
     """Tests for message validation."""
@@ -221,6 +277,7 @@ class TestClaudeConnectorExtractJobPosting:
         assert result.job.company == "Acme Inc"
         assert result.job.location == "San Francisco"
         assert result.model == TEST_MODEL
+        assert json.loads(result.raw_response) == job_data
 
     async def test_extract_job_posting_minimal_fields(
         self, connector_with_mock_client: tuple[ClaudeConnector, AsyncMock]
@@ -238,6 +295,81 @@ class TestClaudeConnectorExtractJobPosting:
         assert result.job.company == "StartupCo"
         assert result.job.location is None
 
+    async def test_extract_job_posting_tool_use_after_text(
+        self, connector_with_mock_client: tuple[ClaudeConnector, AsyncMock]
+    ) -> None:
+        connector, mock_client = connector_with_mock_client
+
+        from anthropic.types import TextBlock
+
+        mock_response = self._create_tool_use_response(
+            {"job_title": "Developer", "company": "StartupCo"}
+        )
+        mock_response.content.insert(0, TextBlock(type="text", text="Sure."))
+        mock_client.messages.create.return_value = mock_response
+
+        result = await connector.extract_job_posting("Job posting text")
+
+        assert result.job.job_title == "Developer"
+
+    async def test_concurrent_identical_extractions_share_one_request(
+        self, connector_with_mock_client: tuple[ClaudeConnector, AsyncMock]
+    ) -> None:
+        connector, mock_client = connector_with_mock_client
+        mock_client.messages.create.return_value = self._create_tool_use_response(
+            {"job_title": "Developer", "company": "StartupCo"}
+        )
+
+        first, second = await asyncio.gather(
+            connector.extract_job_posting("Same posting"),
+            connector.extract_job_posting("Same posting"),
+        )
+
+        assert first is second
+        mock_client.messages.create.assert_called_once()
+        assert connector._inflight == {}
+
+    async def test_failure_after_every_caller_left_is_retrieved(
+        self, connector_with_mock_client: tuple[ClaudeConnector, AsyncMock]
+    ) -> None:
+        connector, mock_client = connector_with_mock_client
+        release = asyncio.Event()
+
+        async def fail_when_released(**_kwargs: Any) -> Any:
+            await release.wait()
+            raise anthropic.APIStatusError(
+                message="bad request", response=MagicMock(status_code=400), body=None
+            )
+
+        mock_client.messages.create.side_effect = fail_when_released
+        caller = asyncio.create_task(connector.extract_job_posting("Same posting"))
+        await asyncio.sleep(0)
+        (task,) = connector._inflight.values()
+
+        # The only waiter disconnects before the shared request fails
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        release.set()
+        await asyncio.wait([task])
+
+        assert connector._inflight == {}
+        # Set when a failed task's exception has never been retrieved
+        assert not task._log_traceback  # type: ignore[attr-defined]
+
+    async def test_sequential_identical_extractions_are_not_coalesced(
+        self, connector_with_mock_client: tuple[ClaudeConnector, AsyncMock]
+    ) -> None:
+        connector, mock_client = connector_with_mock_client
+        mock_client.messages.create.return_value = self._create_tool_use_response(
+            {"job_title": "Developer", "company": "StartupCo"}
+        )
+
+        await connector.extract_job_posting("Same posting")
+        await connector.extract_job_posting("Same posting")
+
+        assert mock_client.messages.create.call_count == 2
+
     async def test_extract_job_posting_no_tool_use(
         self, connector_with_mock_client: tuple[ClaudeConnector, AsyncMock]
     ) -> None:
@@ -268,13 +400,315 @@ class TestClaudeConnectorExtractJobPosting:
             await connector.extract_job_posting("Bad job text")
 
 
+class _FakeMessageStream:
+    """Stand-in for the SDK's message stream context manager."""
+
+    def __init__(self, events: list[object], final_message: object) -> None:
+        self._events = events
+        self._final_message = final_message
+
+    async def __aenter__(self) -> "_FakeMessageStream":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        return None
+
+    async def __aiter__(self) -> AsyncIterator[object]:
+        for event in self._events:
+            yield event
+
+    async def get_final_message(self) -> object:
+        return self._final_message
+
+
+class TestClaudeConnectorStreamJobPosting:
+    """Tests for stream_job_posting method."""
+
+    async def test_stream_yields_completed_fields_then_result(
+        self, connector_with_mock_client: tuple[ClaudeConnector, AsyncMock]
+    ) -> None:
+        connector, mock_client = connector_with_mock_client
+        job_data = {
+            "job_title": "Software Engineer",
+            "company": "Acme Inc",
+            "location": "San Francisco",
+        }
+        events = [
+            SimpleNamespace(type="text", snapshot="Sure."),
+            SimpleNamespace(type="input_json", snapshot={"job_title": "Soft"}),
+            SimpleNamespace(
+                type="input_json",
+                snapshot={"job_title": "Software Engineer", "company": "Ac"},
+            ),
+            SimpleNamespace(type="input_json", snapshot={**job_data, "location": "S"}),
+        ]
+        final_message = MagicMock()
+        final_message.content = [
+            ToolUseBlock(
+                id="tool_123",
+                type="tool_use",
+                name="extract_job_posting",
+                input=job_data,
+            )
+        ]
+        final_message.model = TEST_MODEL
+        mock_client.messages.stream = MagicMock(
+            return_value=_FakeMessageStream(events, final_message)
+        )
+
+        items = [item async for item in connector.stream_job_posting("Job text")]
+
+        assert items[:-1] == [
+            JobFieldEvent(field=name, value=value) for name, value in job_data.items()
+        ]
+        result = items[-1]
+        assert isinstance(result, RawExtractionResult)
+        assert result.job.company == "Acme Inc"
+
+    async def test_stream_validates_text(
+        self, connector_with_mock_client: tuple[ClaudeConnector, AsyncMock]
+    ) -> None:
+        connector, mock_client = connector_with_mock_client
+        mock_client.messages.stream = MagicMock()
+
+        with pytest.raises(ExtractionError, match="empty"):
+            await anext(connector.stream_job_posting("   "))
+
+        mock_client.messages.stream.assert_not_called()
+
+    async def test_stream_api_error_raises_extraction_error(
+        self, connector_with_mock_client: tuple[ClaudeConnector, AsyncMock]
+    ) -> None:
+        connector, mock_client = connector_with_mock_client
+        mock_client.messages.stream = MagicMock(
+            side_effect=anthropic.APIStatusError(
+                message="bad request",
+                response=MagicMock(status_code=400),
+                body=None,
+            )
+        )
+
+        with pytest.raises(ExtractionError, match="Claude API error"):
+            await anext(connector.stream_job_posting("Job text"))
+
+
+class TestClaudeConnectorExtractJobPostingsBatch:
+    """Tests for extract_job_postings_batch method."""
+
+    @staticmethod
+    def _succeeded(custom_id: str, job_data: dict[str, Any]) -> Any:
+        """Create a succeeded batch result carrying a tool_use message."""
+        from anthropic.types.messages import MessageBatchIndividualResponse
+
+        return MessageBatchIndividualResponse.model_validate(
+            {
+                "custom_id": custom_id,
+                "result": {
+                    "type": "succeeded",
+                    "message": {
+                        "id": "msg_123",
+                        "type": "message",
+                        "role": "assistant",
+                        "model": TEST_MODEL,
+                        "content": [
+                            {
+                                "type": "tool_use",
+                                "id": "tool_123",
+                                "name": "extract_job_posting",
+                                "input": job_data,
+                            }
+                        ],
+                        "usage": {"input_tokens": 100, "output_tokens": 200},
+                    },
+                },
+            }
+        )
+
+    @staticmethod
+    def _errored(custom_id: str) -> Any:
+        """Create an errored batch result."""
+        from anthropic.types.messages import MessageBatchIndividualResponse
+
+        return MessageBatchIndividualResponse.model_validate(
+            {
+                "custom_id": custom_id,
+                "result": {
+                    "type": "errored",
+                    "error": {
+                        "type": "error",
+                        "error": {
+                            "type": "invalid_request_error",
+                            "message": "prompt is too long",
+                        },
+                    },
+                },
+            }
+        )
+
+    @staticmethod
+    async def _stream(entries: list[Any]) -> Any:
+        for entry in entries:
+            yield entry
+
+    def _configure_batch(
+        self,
+        mock_client: AsyncMock,
+        entries: list[Any],
+        statuses: tuple[str, ...] = ("ended",),
+    ) -> None:
+        batches = mock_client.messages.batches
+        batches.create.return_value = MagicMock(id="batch_123")
+        batches.retrieve.side_effect = [
+            MagicMock(processing_status=status) for status in statuses
+        ]
+        batches.results.return_value = self._stream(entries)
+
+    async def test_batch_returns_results_in_input_order(
+        self, connector_with_mock_client: tuple[ClaudeConnector, AsyncMock]
+    ) -> None:
+        connector, mock_client = connector_with_mock_client
+        # Results arrive out of order and are matched back via custom_id
+        self._configure_batch(
+            mock_client,
+            [
+                self._succeeded("job-1", {"job_title": "Second", "company": "B"}),
+                self._succeeded("job-0", {"job_title": "First", "company": "A"}),
+            ],
+        )
+
+        results = await connector.extract_job_postings_batch(["first", "second"])
+
+        assert [r.job.job_title for r in results] == ["First", "Second"]  # type: ignore[union-attr]
+        requests = mock_client.messages.batches.create.call_args.kwargs["requests"]
+        assert [r["custom_id"] for r in requests] == ["job-0", "job-1"]
+        assert requests[0]["params"]["tools"][0]["name"] == "extract_job_posting"
+
+    async def test_batch_polls_until_ended(
+        self, connector_with_mock_client: tuple[ClaudeConnector, AsyncMock]
+    ) -> None:
+        connector, mock_client = connector_with_mock_client
+        self._configure_batch(
+            mock_client,
+            [self._succeeded("job-0", {"job_title": "Dev", "company": "Co"})],
+            statuses=("in_progress", "in_progress", "ended"),
+        )
+
+        await connector.extract_job_postings_batch(["text"])
+
+        assert mock_client.messages.batches.retrieve.call_count == 3
+
+    async def test_batch_that_does_not_end_in_time_is_cancelled(
+        self, connector_with_mock_client: tuple[ClaudeConnector, AsyncMock]
+    ) -> None:
+        connector, mock_client = connector_with_mock_client
+        connector.settings.batch_max_wait = 0.0
+        self._configure_batch(mock_client, [], statuses=("in_progress",))
+
+        with pytest.raises(ExtractionError, match="batch_123 did not end"):
+            await connector.extract_job_postings_batch(["text"])
+
+        mock_client.messages.batches.cancel.assert_awaited_once_with("batch_123")
+        mock_client.messages.batches.results.assert_not_called()
+
+    async def test_batch_failed_items_returned_as_errors(
+        self, connector_with_mock_client: tuple[ClaudeConnector, AsyncMock]
+    ) -> None:
+        connector, mock_client = connector_with_mock_client
+        self._configure_batch(
+            mock_client,
+            [
+                self._succeeded("job-0", {"job_title": "Dev", "company": "Co"}),
+                self._errored("job-1"),
+                self._succeeded("job-2", {"location": "Berlin"}),
+            ],
+        )
+
+        results = await connector.extract_job_postings_batch(["a", "b", "c", "d"])
+
+        assert not isinstance(results[0], ExtractionError)
+        assert isinstance(results[1], ExtractionError)
+        assert "prompt is too long" in results[1].message
+        assert isinstance(results[2], ExtractionError)
+        assert "Invalid job data structure" in results[2].message
+        assert isinstance(results[3], ExtractionError)
+        assert "no result" in results[3].message
+
+    async def test_batch_invalid_texts_fail_only_their_slot(
+        self, connector_with_mock_client: tuple[ClaudeConnector, AsyncMock]
+    ) -> None:
+        connector, mock_client = connector_with_mock_client
+        self._configure_batch(
+            mock_client,
+            [self._succeeded("job-1", {"job_title": "Dev", "company": "Co"})],
+        )
+
+        results = await connector.extract_job_postings_batch(["   ", "valid"])
+
+        assert isinstance(results[0], ExtractionError)
+        assert "cannot be empty" in results[0].message
+        assert not isinstance(results[1], ExtractionError)
+        requests = mock_client.messages.batches.create.call_args.kwargs["requests"]
+        assert [r["custom_id"] for r in requests] == ["job-1"]
+
+    async def test_batch_of_only_invalid_texts_is_not_submitted(
+        self, connector_with_mock_client: tuple[ClaudeConnector, AsyncMock]
+    ) -> None:
+        connector, mock_client = connector_with_mock_client
+
+        results = await connector.extract_job_postings_batch(["", "   "])
+
+        assert all(isinstance(r, ExtractionError) for r in results)
+        mock_client.messages.batches.create.assert_not_called()
+
+    async def test_batch_api_error_raises_extraction_error(
+        self, connector_with_mock_client: tuple[ClaudeConnector, AsyncMock]
+    ) -> None:
+        connector, mock_client = connector_with_mock_client
+        mock_client.messages.batches.create.side_effect = anthropic.APIStatusError(
+            message="bad request",
+            response=MagicMock(status_code=400),
+            body=None,
+        )
+
+        with pytest.raises(ExtractionError, match="batch API error"):
+            await connector.extract_job_postings_batch(["text"])
+
+
 class TestClaudeConnectorLifecycle:
     """Tests for connector lifecycle methods."""
 
-    async def test_initialize_is_noop(
+    async def test_initialize_without_warmup_is_noop(
+        self, connector_with_mock_client: tuple[ClaudeConnector, AsyncMock]
+    ) -> None:
+        connector, _ = connector_with_mock_client
+        connector._http = AsyncMock()
+
+        await connector.initialize()
+
+        connector._http.head.assert_not_called()
+
+    async def test_initialize_warms_up_connection(
+        self, connector_with_mock_client: tuple[ClaudeConnector, AsyncMock]
+    ) -> None:
+        connector, mock_client = connector_with_mock_client
+        connector.settings.warmup_on_startup = True
+        mock_client.base_url = "https://api.anthropic.com"
+        connector._http = AsyncMock()
+
+        await connector.initialize()
+
+        connector._http.head.assert_called_once_with(
+            "https://api.anthropic.com", timeout=5.0
+        )
+
+    async def test_initialize_ignores_warmup_failure(
         self, connector_with_mock_client: tuple[ClaudeConnector, AsyncMock]
     ) -> None:
         connector, _ = connector_with_mock_client
+        connector.settings.warmup_on_startup = True
+        connector._http = AsyncMock()
+        connector._http.head.side_effect = httpx.ConnectError("no network")
+
         await connector.initialize()  # Should not raise
 
     async def test_cleanup_closes_client(
@@ -7,6 +7,7 @@ from job_posting_extractor.exceptions import (
     ConfigurationError,
     ExtractionError,
     InputValidationError,
+    RequestTooLargeError,
 )
 
 
@@ -49,8 +50,14 @@ class TestDerivedExceptions:
             (ExtractionError, "EXTRACTION_ERROR", 422),
             (InputValidationError, "INPUT_VALIDATION_ERROR", 400),
             (ConfigurationError, "CONFIGURATION_ERROR", 500),
+            (RequestTooLargeError, "REQUEST_TOO_LARGE", 413),
+        ],
+        ids=[
+            "ExtractionError",
+            "InputValidationError",
+            "ConfigurationError",
+            "RequestTooLargeError",
         ],
-        ids=["ExtractionError", "InputValidationError", "ConfigurationError"],
     )
     def test_default_values(
         self,
@@ -65,7 +72,12 @@ class TestDerivedExceptions:
 
     @pytest.mark.parametrize(
         "exception_class",
-        [ExtractionError, InputValidationError, ConfigurationError],
+        [
+            ExtractionError,
+            InputValidationError,
+            ConfigurationError,
+            RequestTooLargeError,
+        ],
     )
     def test_is_business_error_subclass(
         self, exception_class: type[BusinessError]
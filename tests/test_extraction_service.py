@@ -1,13 +1,22 @@
 """Tests for ExtractionService."""
 
+import sqlite3
+from collections.abc import Callable
+from pathlib import Path
+from typing import NoReturn
 from unittest.mock import AsyncMock
 
 import pytest
 
-from job_posting_extractor.exceptions import ExtractionError
+from job_posting_extractor.connectors.base import BatchJobExtractor, JobExtractor
+from job_posting_extractor.connectors.mock_claude import MockClaudeConnector
+from job_posting_extractor.exceptions import ConfigurationError, ExtractionError
 from job_posting_extractor.models import (
+    Confidence,
     EmploymentType,
     ExperienceLevel,
+    JobExtractionResponse,
+    JobFieldEvent,
     JobPosting,
     RawExtractionResult,
     SalaryRange,
@@ -15,49 +24,157 @@ from job_posting_extractor.models import (
     WorkLocation,
 )
 from job_posting_extractor.services.extraction import ExtractionService
-from tests import TEST_MODEL
+from job_posting_extractor.services.parallel import (
+    AsyncLimiter,
+    MicroBatcher,
+    estimate_tokens,
+)
+from job_posting_extractor.services.persistent_cache import ExtractionCache
+from job_posting_extractor.services.semantic_cache import SemanticCache
+from tests import TEST_MODEL, StubExtractor
+
+_SALARY_FULL = SalaryRange(min=50000, max=80000)
+_SALARY_MIN = SalaryRange(min=40000)
+_JOB_DEFAULTS: dict[str, object] = {"job_title": "Developer", "company": "TestCo"}
 
 
 def _create_job(**kwargs: object) -> JobPosting:
-    """Helper to create job postings with specific fields."""
-    defaults = {"job_title": "Developer", "company": "TestCo"}
-    return JobPosting(**{**defaults, **kwargs})  # type: ignore[arg-type]
-
-
-def _create_result(job: JobPosting) -> RawExtractionResult:
-    """Helper to create extraction results."""
-    return RawExtractionResult(
-        job=job,
-        raw_response="{}",
-        model="test-model",
-        usage=UsageInfo(input_tokens=10, output_tokens=20),
+    """Helper to create job postings with specific fields.
+
+    Skips validation: these only feed the service and its confidence
+    helper, and model validation has its own tests.
+    """
+    return JobPosting.model_construct(**_JOB_DEFAULTS | kwargs)
+
+
+def _as_cache_hit(response: JobExtractionResponse) -> JobExtractionResponse:
+    """The response a cache hit returns: the same, but with zero usage."""
+    return response.model_copy(
+        update={"usage": UsageInfo(input_tokens=0, output_tokens=0)}
     )
 
 
+_CONFIDENCE_CASES: dict[str, tuple[dict[str, object], Confidence]] = {
+    # High confidence: 6+ optional fields
+    "many_fields": (
+        {
+            "location": "Berlin",
+            "work_location": WorkLocation.REMOTE,
+            "employment_type": EmploymentType.FULL_TIME,
+            "experience_level": ExperienceLevel.SENIOR,
+            "salary": _SALARY_FULL,
+            "requirements": ["Python"],
+            "responsibilities": ["Code"],
+            "benefits": ["Health insurance"],
+        },
+        "high",
+    ),
+    # High confidence boundary: exactly 6 fields
+    "boundary_at_six": (
+        {
+            "location": "Berlin",
+            "work_location": WorkLocation.REMOTE,
+            "employment_type": EmploymentType.CONTRACT,
+            "experience_level": ExperienceLevel.MID,
+            "salary": _SALARY_MIN,
+            "requirements": ["Python"],
+        },
+        "high",
+    ),
+    # High confidence reached only through the list fields checked last
+    "six_including_last_checked": (
+        {
+            "location": "Berlin",
+            "work_location": WorkLocation.REMOTE,
+            "salary": _SALARY_MIN,
+            "nice_to_have": ["Docker"],
+            "responsibilities": ["Code"],
+            "benefits": ["Health insurance"],
+        },
+        "high",
+    ),
+    # Medium confidence: 3-5 optional fields
+    "some_fields": (
+        {
+            "location": "Berlin",
+            "work_location": WorkLocation.HYBRID,
+            "employment_type": EmploymentType.FULL_TIME,
+        },
+        "medium",
+    ),
+    # Medium confidence boundary: exactly 3 fields
+    "boundary_at_three": (
+        {
+            "location": "Berlin",
+            "work_location": WorkLocation.ON_SITE,
+            "requirements": ["JavaScript"],
+        },
+        "medium",
+    ),
+    # Low confidence: 0-2 optional fields
+    "few_fields": (
+        {"location": "Berlin"},
+        "low",
+    ),
+    # Low confidence: no optional fields
+    "no_optional_fields": (
+        {},
+        "low",
+    ),
+    # Low confidence: empty lists don't count
+    "empty_lists_not_counted": (
+        {"requirements": [], "responsibilities": [], "benefits": []},
+        "low",
+    ),
+}
+
+
+class _StubEmbedder:
+    """Embedder stub mapping every text to the same direction."""
+
+    def embed(self, text: str) -> list[float]:
+        return [1.0, float(len(text) % 2) * 0.01]
+
+
 class TestExtractionService:
     """Tests for ExtractionService."""
 
     async def test_extract_job_returns_response(
         self,
-        mock_job_extractor: AsyncMock,
+        stub_extractor: StubExtractor,
+        service: ExtractionService,
         sample_job_posting: JobPosting,
     ) -> None:
-        service = ExtractionService(connector=mock_job_extractor)
         result = await service.extract_job("Sample job posting text")
 
         assert result.job == sample_job_posting
         assert result.confidence in ["high", "medium", "low"]
         assert result.model == TEST_MODEL
-        mock_job_extractor.extract_job_posting.assert_called_once_with(
-            "Sample job posting text"
+        assert stub_extractor.calls == ["Sample job posting text"]
+
+    async def test_response_matches_validated_construction(
+        self,
+        service: ExtractionService,
+        sample_raw_extraction_result: RawExtractionResult,
+    ) -> None:
+        response = await service.extract_job("Sample job posting text")
+
+        validated = JobExtractionResponse(
+            job=sample_raw_extraction_result.job,
+            confidence=response.confidence,
+            raw_response=sample_raw_extraction_result.raw_response,
+            model=sample_raw_extraction_result.model,
+            usage=sample_raw_extraction_result.usage,
         )
+        assert response == validated
+        # Guards against new response fields being left out of model_construct
+        assert response.model_fields_set == set(JobExtractionResponse.model_fields)
 
     async def test_cleanup_delegates_to_connector(
-        self, mock_job_extractor: AsyncMock
+        self, stub_extractor: StubExtractor, service: ExtractionService
     ) -> None:
-        service = ExtractionService(connector=mock_job_extractor)
         await service.cleanup()
-        mock_job_extractor.cleanup.assert_called_once()
+        assert stub_extractor.cleaned_up
 
 
 class TestConfidenceCalculation:
@@ -65,125 +182,436 @@ class TestConfidenceCalculation:
 
     @pytest.mark.parametrize(
         ("job_kwargs", "expected_confidence"),
-        [
-            # High confidence: 6+ optional fields
-            pytest.param(
-                {
-                    "location": "Berlin",
-                    "work_location": WorkLocation.REMOTE,
-                    "employment_type": EmploymentType.FULL_TIME,
-                    "experience_level": ExperienceLevel.SENIOR,
-                    "salary": SalaryRange(min=50000, max=80000),
-                    "requirements": ["Python"],
-                    "responsibilities": ["Code"],
-                    "benefits": ["Health insurance"],
-                },
-                "high",
-                id="many_fields",
-            ),
-            # High confidence boundary: exactly 6 fields
-            pytest.param(
-                {
-                    "location": "Berlin",
-                    "work_location": WorkLocation.REMOTE,
-                    "employment_type": EmploymentType.CONTRACT,
-                    "experience_level": ExperienceLevel.MID,
-                    "salary": SalaryRange(min=40000),
-                    "requirements": ["Python"],
-                },
-                "high",
-                id="boundary_at_six",
-            ),
-            # Medium confidence: 3-5 optional fields
-            pytest.param(
-                {
-                    "location": "Berlin",
-                    "work_location": WorkLocation.HYBRID,
-                    "employment_type": EmploymentType.FULL_TIME,
-                },
-                "medium",
-                id="some_fields",
-            ),
-            # Medium confidence boundary: exactly 3 fields
-            pytest.param(
-                {
-                    "location": "Berlin",
-                    "work_location": WorkLocation.ON_SITE,
-                    "requirements": ["JavaScript"],
-                },
-                "medium",
-                id="boundary_at_three",
-            ),
-            # Low confidence: 0-2 optional fields
-            pytest.param(
-                {"location": "Berlin"},
-                "low",
-                id="few_fields",
-            ),
-            # Low confidence: no optional fields
-            pytest.param(
-                {},
-                "low",
-                id="no_optional_fields",
-            ),
-            # Low confidence: empty lists don't count
-            pytest.param(
-                {"requirements": [], "responsibilities": [], "benefits": []},
-                "low",
-                id="empty_lists_not_counted",
-            ),
-        ],
+        _CONFIDENCE_CASES.values(),
+        ids=_CONFIDENCE_CASES.keys(),
     )
-    async def test_confidence_levels(
-        self,
-        mock_job_extractor: AsyncMock,
-        job_kwargs: dict,
-        expected_confidence: str,
+    def test_confidence_levels(
+        self, job_kwargs: dict[str, object], expected_confidence: Confidence
     ) -> None:
         job = _create_job(**job_kwargs)
-        mock_job_extractor.extract_job_posting.return_value = _create_result(job)
+        assert ExtractionService._calculate_confidence(job) == expected_confidence
+
+    async def test_confidence_is_applied_to_response(
+        self,
+        stub_extractor: StubExtractor,
+        service: ExtractionService,
+        raw_result_factory: Callable[..., RawExtractionResult],
+    ) -> None:
+        stub_extractor.result = raw_result_factory(_create_job())
 
-        service = ExtractionService(connector=mock_job_extractor)
         result = await service.extract_job("job text")
 
-        assert result.confidence == expected_confidence
+        assert result.confidence == "low"
 
 
 class TestExtractionServiceErrorPaths:
     """Tests for error propagation from connector to service."""
 
     async def test_extraction_error_propagates(
-        self, mock_job_extractor: AsyncMock
+        self, stub_extractor: StubExtractor, service: ExtractionService
     ) -> None:
-        mock_job_extractor.extract_job_posting.side_effect = ExtractionError(
-            "Failed to extract job data"
-        )
-        service = ExtractionService(connector=mock_job_extractor)
+        stub_extractor.outcomes = [ExtractionError("Failed to extract job data")]
 
         with pytest.raises(ExtractionError, match="Failed to extract job data"):
             await service.extract_job("Some job posting")
 
     async def test_unexpected_error_propagates(
-        self, mock_job_extractor: AsyncMock
+        self, stub_extractor: StubExtractor, service: ExtractionService
     ) -> None:
-        mock_job_extractor.extract_job_posting.side_effect = RuntimeError(
-            "Connection lost"
-        )
-        service = ExtractionService(connector=mock_job_extractor)
+        stub_extractor.outcomes = [RuntimeError("Connection lost")]
 
         with pytest.raises(RuntimeError, match="Connection lost"):
             await service.extract_job("Some job posting")
 
     async def test_cleanup_error_propagates(
-        self, mock_job_extractor: AsyncMock
+        self, stub_extractor: StubExtractor, service: ExtractionService
     ) -> None:
-        mock_job_extractor.cleanup.side_effect = RuntimeError("Cleanup failed")
-        service = ExtractionService(connector=mock_job_extractor)
+        stub_extractor.cleanup_error = RuntimeError("Cleanup failed")
 
         with pytest.raises(RuntimeError, match="Cleanup failed"):
             await service.cleanup()
 
 
+class TestExtractJobs:
+    """Tests for concurrent extraction of many postings."""
+
+    async def test_extract_jobs_applies_confidence_and_keeps_errors(
+        self,
+        stub_extractor: StubExtractor,
+        service: ExtractionService,
+        sample_raw_extraction_result: RawExtractionResult,
+    ) -> None:
+        stub_extractor.outcomes = [
+            sample_raw_extraction_result,
+            ExtractionError("Claude did not return structured output"),
+        ]
+
+        results = await service.extract_jobs(["first", "second"])
+
+        assert isinstance(results[0], JobExtractionResponse)
+        assert results[0].confidence == "high"
+        assert isinstance(results[1], ExtractionError)
+        assert len(stub_extractor.calls) == 2
+
+    async def test_repeated_texts_are_extracted_once(
+        self, stub_extractor: StubExtractor, service: ExtractionService
+    ) -> None:
+        results = await service.extract_jobs(["same", "other", "same"])
+
+        assert len(results) == 3
+        assert results[0] is results[2]
+        assert len(stub_extractor.calls) == 2
+
+    async def test_cached_texts_skip_the_connector(
+        self, stub_extractor: StubExtractor
+    ) -> None:
+        service = ExtractionService(connector=stub_extractor, cache_size=8)
+        cached = await service.extract_job("cached")
+
+        results = await service.extract_jobs(["cached", "new"])
+
+        assert results[0] == _as_cache_hit(cached)
+        assert stub_extractor.calls == ["cached", "new"]
+
+
+class TestExtractJobsBatch:
+    """Tests for batch extraction."""
+
+    async def test_batch_applies_confidence_and_keeps_errors(
+        self, sample_raw_extraction_result: RawExtractionResult
+    ) -> None:
+        error = ExtractionError("Claude batch request expired")
+        connector = AsyncMock(spec=BatchJobExtractor)
+        connector.model = TEST_MODEL
+        connector.extract_job_postings_batch.return_value = [
+            sample_raw_extraction_result,
+            error,
+        ]
+        service = ExtractionService(connector=connector)
+
+        results = await service.extract_jobs_batch(["first", "second"])
+
+        assert isinstance(results[0], JobExtractionResponse)
+        assert results[0].confidence == "high"
+        assert results[1] is error
+        connector.extract_job_postings_batch.assert_called_once_with(
+            ["first", "second"]
+        )
+
+    async def test_batch_unsupported_connector_raises(self) -> None:
+        connector = AsyncMock(spec=JobExtractor)
+        service = ExtractionService(connector=connector)
+
+        with pytest.raises(ConfigurationError, match="does not support batch"):
+            await service.extract_jobs_batch(["text"])
+
+    async def test_batch_skips_repeated_texts(
+        self, sample_raw_extraction_result: RawExtractionResult
+    ) -> None:
+        connector = AsyncMock(spec=BatchJobExtractor)
+        connector.model = TEST_MODEL
+        connector.extract_job_postings_batch.return_value = [
+            sample_raw_extraction_result
+        ]
+        service = ExtractionService(connector=connector)
+
+        results = await service.extract_jobs_batch(["same", "same"])
+
+        assert results[0] is results[1]
+        connector.extract_job_postings_batch.assert_called_once_with(["same"])
+
+
+class TestExtractJobCache:
+    """Tests for the in-process response cache."""
+
+    async def test_repeated_text_is_served_from_cache(
+        self, stub_extractor: StubExtractor
+    ) -> None:
+        service = ExtractionService(connector=stub_extractor, cache_size=8)
+
+        first = await service.extract_job("Same posting")
+        second = await service.extract_job("Same posting")
+
+        assert second == _as_cache_hit(first)
+        assert len(stub_extractor.calls) == 1
+
+    async def test_cache_hit_reports_zero_usage(
+        self,
+        stub_extractor: StubExtractor,
+        sample_raw_extraction_result: RawExtractionResult,
+    ) -> None:
+        service = ExtractionService(connector=stub_extractor, cache_size=8)
+
+        first = await service.extract_job("Same posting")
+        second = await service.extract_job("Same posting")
+        third = await service.extract_job("Same posting")
+
+        assert first.usage == sample_raw_extraction_result.usage
+        assert second.usage == third.usage == UsageInfo(input_tokens=0, output_tokens=0)
+
+    async def test_cache_is_keyed_by_model(self, stub_extractor: StubExtractor) -> None:
+        service = ExtractionService(connector=stub_extractor, cache_size=8)
+
+        await service.extract_job("Same posting")
+        stub_extractor.model = "other-model"
+        await service.extract_job("Same posting")
+
+        assert len(stub_extractor.calls) == 2
+
+    async def test_failed_extraction_is_not_cached(
+        self,
+        stub_extractor: StubExtractor,
+        sample_raw_extraction_result: RawExtractionResult,
+    ) -> None:
+        stub_extractor.outcomes = [
+            ExtractionError("Claude did not return structured output"),
+            sample_raw_extraction_result,
+        ]
+        service = ExtractionService(connector=stub_extractor, cache_size=8)
+
+        with pytest.raises(ExtractionError):
+            await service.extract_job("Same posting")
+        response = await service.extract_job("Same posting")
+
+        assert response.job == sample_raw_extraction_result.job
+        assert len(stub_extractor.calls) == 2
+
+    async def test_cache_disabled_by_default(
+        self, stub_extractor: StubExtractor, service: ExtractionService
+    ) -> None:
+        await service.extract_job("Same posting")
+        await service.extract_job("Same posting")
+
+        assert len(stub_extractor.calls) == 2
+
+
+class TestExtractJobSemanticCache:
+    """Tests for serving near-duplicate texts from the semantic cache."""
+
+    async def test_semantic_hit_skips_connector(
+        self, stub_extractor: StubExtractor
+    ) -> None:
+        cache = SemanticCache(_StubEmbedder(), min_chars=0)
+        service = ExtractionService(connector=stub_extractor, semantic_cache=cache)
+
+        first = await service.extract_job("Senior Python Developer at TechCorp")
+        second = await service.extract_job("Senior Python Developer at TechCorp!")
+
+        assert second == _as_cache_hit(first)
+        assert len(stub_extractor.calls) == 1
+
+    async def test_semantic_hit_is_streamed_as_response(
+        self, mock_connector: MockClaudeConnector
+    ) -> None:
+        cache = SemanticCache(_StubEmbedder(), min_chars=0)
+        service = ExtractionService(connector=mock_connector, semantic_cache=cache)
+        first = await service.extract_job("Senior Python Developer at TechCorp")
+
+        events = [e async for e in service.stream_extract("Senior Python Developer!")]
+
+        assert events == [_as_cache_hit(first)]
+
+    async def test_streamed_response_is_cached(
+        self, mock_connector: MockClaudeConnector
+    ) -> None:
+        cache = SemanticCache(_StubEmbedder(), min_chars=0)
+        service = ExtractionService(connector=mock_connector, semantic_cache=cache)
+        events = [e async for e in service.stream_extract("Senior Python Developer")]
+
+        response = events[-1]
+        assert isinstance(response, JobExtractionResponse)
+        hit = await service.extract_job("Senior Python Developer!")
+        assert hit == _as_cache_hit(response)
+
+
+class TestExtractJobPersistentCache:
+    """Tests for serving repeated texts from the persistent cache."""
+
+    async def test_persistent_hit_skips_connector(
+        self, stub_extractor: StubExtractor, tmp_path: Path
+    ) -> None:
+        cache = ExtractionCache(str(tmp_path / "cache.db"))
+        await cache.open()
+        try:
+            # A fresh service stands in for another worker or a restart
+            first = await ExtractionService(
+                connector=stub_extractor, persistent_cache=cache
+            ).extract_job("Same posting")
+            second = await ExtractionService(
+                connector=stub_extractor, persistent_cache=cache
+            ).extract_job("Same posting")
+        finally:
+            await cache.close()
+
+        assert second == _as_cache_hit(first)
+        assert len(stub_extractor.calls) == 1
+
+    async def test_cache_failure_does_not_fail_extraction(
+        self,
+        stub_extractor: StubExtractor,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        cache = ExtractionCache(str(tmp_path / "cache.db"))
+        await cache.open()
+
+        def locked(*_args: object) -> NoReturn:
+            raise sqlite3.OperationalError("database is locked")
+
+        try:
+            monkeypatch.setattr(cache._connection, "execute", locked)
+            service = ExtractionService(
+                connector=stub_extractor, persistent_cache=cache
+            )
+            response = await service.extract_job("Same posting")
+        finally:
+            await cache.close()
+
+        assert response.confidence == "high"
+        assert stub_extractor.calls == ["Same posting"]
+
+    async def test_entries_from_other_extraction_settings_are_ignored(
+        self, stub_extractor: StubExtractor, tmp_path: Path
+    ) -> None:
+        cache = ExtractionCache(str(tmp_path / "cache.db"))
+        await cache.open()
+        try:
+            # A redeploy with different settings sharing the same database
+            await ExtractionService(
+                connector=stub_extractor,
+                persistent_cache=cache,
+                cache_namespace="max_tokens=1024",
+            ).extract_job("Same posting")
+            await ExtractionService(
+                connector=stub_extractor,
+                persistent_cache=cache,
+                cache_namespace="max_tokens=2048",
+            ).extract_job("Same posting")
+        finally:
+            await cache.close()
+
+        assert len(stub_extractor.calls) == 2
+
+
+class TestExtractJobRateLimiting:
+    """Tests for direct extractions sharing the service's rate limiter."""
+
+    @pytest.fixture
+    def limiter(self, monkeypatch: pytest.MonkeyPatch) -> AsyncLimiter:
+        limiter = AsyncLimiter(rpm=10, tpm=1000)
+        monkeypatch.setattr(limiter, "acquire", AsyncMock())
+        return limiter
+
+    async def test_extraction_consumes_a_limiter_slot(
+        self, stub_extractor: StubExtractor, limiter: AsyncLimiter
+    ) -> None:
+        service = ExtractionService(connector=stub_extractor, limiter=limiter)
+
+        await service.extract_job("Job posting text")
+
+        limiter.acquire.assert_awaited_once_with(  # type: ignore[attr-defined]
+            estimate_tokens("Job posting text")
+        )
+
+    async def test_stream_consumes_a_limiter_slot(
+        self, mock_connector: MockClaudeConnector, limiter: AsyncLimiter
+    ) -> None:
+        service = ExtractionService(connector=mock_connector, limiter=limiter)
+
+        [e async for e in service.stream_extract("Job posting text")]
+
+        limiter.acquire.assert_awaited_once_with(  # type: ignore[attr-defined]
+            estimate_tokens("Job posting text")
+        )
+
+    async def test_cache_hit_does_not_consume_a_slot(
+        self, stub_extractor: StubExtractor, limiter: AsyncLimiter
+    ) -> None:
+        service = ExtractionService(
+            connector=stub_extractor, limiter=limiter, cache_size=8
+        )
+
+        await service.extract_job("Job posting text")
+        await service.extract_job("Job posting text")
+
+        limiter.acquire.assert_awaited_once()  # type: ignore[attr-defined]
+
+
+class TestExtractJobMicroBatching:
+    """Tests for routing single extractions through a micro-batcher."""
+
+    async def test_extract_job_uses_batcher(
+        self,
+        stub_extractor: StubExtractor,
+        sample_raw_extraction_result: RawExtractionResult,
+    ) -> None:
+        batcher = AsyncMock(spec=MicroBatcher)
+        batcher.submit.return_value = sample_raw_extraction_result
+        service = ExtractionService(connector=stub_extractor, batcher=batcher)
+
+        response = await service.extract_job("Job posting text")
+
+        assert response.confidence == "high"
+        batcher.submit.assert_awaited_once_with("Job posting text")
+        assert stub_extractor.calls == []
+
+    async def test_invalid_text_rejected_before_batching(
+        self, stub_extractor: StubExtractor
+    ) -> None:
+        batcher = AsyncMock(spec=MicroBatcher)
+        service = ExtractionService(connector=stub_extractor, batcher=batcher)
+
+        with pytest.raises(ExtractionError, match="too long"):
+            await service.extract_job("x" * 50_001)
+
+        batcher.submit.assert_not_called()
+
+
+class TestStreamExtract:
+    """Tests for streaming extraction."""
+
+    async def test_streams_fields_then_response(
+        self, extraction_service: ExtractionService
+    ) -> None:
+        events = [e async for e in extraction_service.stream_extract("Job posting")]
+
+        fields = [e.field for e in events[:-1] if isinstance(e, JobFieldEvent)]
+        assert fields[:2] == ["job_title", "company"]
+        assert len(fields) == len(events) - 1
+        response = events[-1]
+        assert isinstance(response, JobExtractionResponse)
+        assert response.confidence == "high"
+
+    async def test_non_streaming_connector_yields_only_response(
+        self, sample_raw_extraction_result: RawExtractionResult
+    ) -> None:
+        connector = AsyncMock(spec=JobExtractor)
+        connector.model = TEST_MODEL
+        connector.extract_job_posting.return_value = sample_raw_extraction_result
+        service = ExtractionService(connector=connector)
+
+        events = [e async for e in service.stream_extract("Job posting")]
+
+        assert len(events) == 1
+        assert isinstance(events[0], JobExtractionResponse)
+
+    async def test_cached_text_yields_only_response(
+        self, mock_connector: MockClaudeConnector
+    ) -> None:
+        service = ExtractionService(connector=mock_connector, cache_size=8)
+        cached = await service.extract_job("Job posting")
+
+        events = [e async for e in service.stream_extract("Job posting")]
+
+        assert events == [_as_cache_hit(cached)]
+
+    def test_invalid_text_raises_before_streaming(
+        self, extraction_service: ExtractionService
+    ) -> None:
+        with pytest.raises(ExtractionError, match="empty"):
+            extraction_service.stream_extract("   ")
+
+
 class TestExtractionServiceWithMockConnector:
     """Integration tests using MockClaudeConnector."""
 
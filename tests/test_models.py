@@ -3,7 +3,7 @@
 from datetime import date
 
 import pytest
-from pydantic import HttpUrl, ValidationError
+from pydantic import BaseModel, HttpUrl, ValidationError
 
 from job_posting_extractor.models import (
     ClaudeResponse,
@@ -20,26 +20,32 @@ from job_posting_extractor.models import (
 from tests import TEST_MODEL
 
 
-class TestUsageInfo:
-    """Tests for UsageInfo model."""
-
-    def test_valid_usage_info(self) -> None:
-        usage = UsageInfo(input_tokens=100, output_tokens=200)
-        assert usage.input_tokens == 100
-        assert usage.output_tokens == 200
-
-
-class TestClaudeResponse:
-    """Tests for ClaudeResponse model."""
-
-    def test_valid_claude_response(self) -> None:
-        response = ClaudeResponse(
-            response="Hello",
-            model=TEST_MODEL,
-            usage=UsageInfo(input_tokens=10, output_tokens=5),
-        )
-        assert response.response == "Hello"
-        assert response.model == TEST_MODEL
+class TestTrivialModels:
+    """Round-trip tests for models without custom validation."""
+
+    @pytest.mark.parametrize(
+        ("model_cls", "fields"),
+        [
+            pytest.param(
+                UsageInfo,
+                {"input_tokens": 100, "output_tokens": 200},
+                id="usage_info",
+            ),
+            pytest.param(
+                ClaudeResponse,
+                {
+                    "response": "Hello",
+                    "model": TEST_MODEL,
+                    "usage": {"input_tokens": 10, "output_tokens": 5},
+                },
+                id="claude_response",
+            ),
+        ],
+    )
+    def test_round_trip(
+        self, model_cls: type[BaseModel], fields: dict[str, object]
+    ) -> None:
+        assert model_cls(**fields).model_dump() == fields
 
 
 class TestSalaryRange:
@@ -100,7 +106,9 @@ class TestJobPosting:
                 company="Co",
                 application_url="not-a-url",  # type: ignore[arg-type]
             )
-        assert "application_url" in str(exc_info.value)
+        errors = exc_info.value.errors()
+        assert [e["loc"] for e in errors] == [("application_url",)]
+        assert errors[0]["type"] == "url_parsing"
 
     def test_job_posting_with_dates(self) -> None:
         job = JobPosting(
@@ -137,12 +145,19 @@ class TestJobExtractionRequest:
     def test_request_rejects_empty_text(self) -> None:
         with pytest.raises(ValidationError) as exc_info:
             JobExtractionRequest(text="")
-        assert "String should have at least 1 character" in str(exc_info.value)
+        errors = exc_info.value.errors()
+        assert len(errors) == 1
+        assert errors[0]["type"] == "string_too_short"
+        assert errors[0]["loc"] == ("text",)
 
     def test_request_rejects_whitespace_only(self) -> None:
         with pytest.raises(ValidationError) as exc_info:
             JobExtractionRequest(text="   \n\t  ")
-        assert "whitespace" in str(exc_info.value).lower()
+        errors = exc_info.value.errors()
+        assert len(errors) == 1
+        assert errors[0]["type"] == "value_error"
+        assert errors[0]["loc"] == ("text",)
+        assert "whitespace" in errors[0]["msg"].lower()
 
     def test_request_accepts_text_with_whitespace(self) -> None:
         request = JobExtractionRequest(text="  Valid text  ")
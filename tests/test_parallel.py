@@ -0,0 +1,279 @@
+"""Tests for concurrent extraction helpers."""
+
+import asyncio
+
+import pytest
+
+from job_posting_extractor.exceptions import ExtractionError
+from job_posting_extractor.models import RawExtractionResult
+from job_posting_extractor.services import parallel
+from job_posting_extractor.services.parallel import (
+    AsyncLimiter,
+    MicroBatcher,
+    extract_jobs_concurrent,
+)
+
+
+class _FakeClock:
+    """Monotonic clock that only advances when the limiter sleeps."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+
+@pytest.fixture
+def fake_clock(monkeypatch: pytest.MonkeyPatch) -> _FakeClock:
+    clock = _FakeClock()
+    monkeypatch.setattr(parallel, "monotonic", clock.monotonic)
+    monkeypatch.setattr(parallel.asyncio, "sleep", clock.sleep)
+    return clock
+
+
+class _TrackingExtractor:
+    """Connector stub that records how many extractions run at once."""
+
+    def __init__(self, result: RawExtractionResult) -> None:
+        self._result = result
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def extract_job_posting(self, job_text: str) -> RawExtractionResult:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        if job_text == "extraction error":
+            raise ExtractionError("Claude did not return structured output")
+        if job_text == "unexpected error":
+            raise RuntimeError("Connection lost")
+        return self._result
+
+
+class TestAsyncLimiter:
+    """Tests for the RPM/TPM token-bucket limiter."""
+
+    async def test_burst_within_capacity_does_not_wait(
+        self, fake_clock: _FakeClock
+    ) -> None:
+        limiter = AsyncLimiter(rpm=3, tpm=1000)
+        for _ in range(3):
+            async with limiter(estimated_tokens=100):
+                pass
+        assert fake_clock.sleeps == []
+
+    async def test_waits_for_request_refill(self, fake_clock: _FakeClock) -> None:
+        limiter = AsyncLimiter(rpm=2, tpm=1000)
+        for _ in range(3):
+            await limiter.acquire()
+        # One request refills every 60 / rpm seconds
+        assert fake_clock.sleeps == [pytest.approx(30.0)]
+
+    async def test_waits_for_token_refill(self, fake_clock: _FakeClock) -> None:
+        limiter = AsyncLimiter(rpm=100, tpm=600)
+        await limiter.acquire(tokens=600)
+        await limiter.acquire(tokens=60)
+        # 600 tokens/min refill 10 tokens per second
+        assert fake_clock.sleeps == [pytest.approx(6.0)]
+
+    async def test_oversized_request_capped_at_capacity(
+        self, fake_clock: _FakeClock
+    ) -> None:
+        limiter = AsyncLimiter(rpm=100, tpm=600)
+        await limiter.acquire(tokens=10_000)
+        assert fake_clock.sleeps == []
+
+
+class TestExtractJobsConcurrent:
+    """Tests for extract_jobs_concurrent."""
+
+    async def test_results_in_input_order_with_errors(
+        self, sample_raw_extraction_result: RawExtractionResult
+    ) -> None:
+        connector = _TrackingExtractor(sample_raw_extraction_result)
+
+        results = await extract_jobs_concurrent(
+            connector,  # type: ignore[arg-type]
+            ["ok", "extraction error", "unexpected error"],
+            max_concurrency=3,
+        )
+
+        assert results[0] is sample_raw_extraction_result
+        assert isinstance(results[1], ExtractionError)
+        assert "structured output" in results[1].message
+        assert isinstance(results[2], ExtractionError)
+        assert "Connection lost" in results[2].message
+
+    async def test_concurrency_is_bounded(
+        self, sample_raw_extraction_result: RawExtractionResult
+    ) -> None:
+        connector = _TrackingExtractor(sample_raw_extraction_result)
+
+        await extract_jobs_concurrent(
+            connector,  # type: ignore[arg-type]
+            ["ok"] * 10,
+            max_concurrency=3,
+        )
+
+        assert connector.max_in_flight == 3
+
+    async def test_uses_limiter(
+        self,
+        fake_clock: _FakeClock,
+        sample_raw_extraction_result: RawExtractionResult,
+    ) -> None:
+        connector = _TrackingExtractor(sample_raw_extraction_result)
+        limiter = AsyncLimiter(rpm=2, tpm=1000)
+
+        results = await extract_jobs_concurrent(
+            connector,  # type: ignore[arg-type]
+            ["ok"] * 3,
+            max_concurrency=3,
+            limiter=limiter,
+        )
+
+        assert len(results) == 3
+        assert fake_clock.sleeps == [pytest.approx(30.0)]
+
+
+class _RecordingBatchHandler:
+    """Batch handler stub that records the batches it receives."""
+
+    def __init__(self, result: RawExtractionResult) -> None:
+        self._result = result
+        self.batches: list[list[str]] = []
+
+    async def __call__(
+        self, job_texts: list[str]
+    ) -> list[RawExtractionResult | ExtractionError]:
+        self.batches.append(job_texts)
+        return [
+            ExtractionError("Claude batch request expired")
+            if text == "expired"
+            else self._result
+            for text in job_texts
+        ]
+
+
+class TestMicroBatcher:
+    """Tests for grouping single extractions into batches."""
+
+    async def test_concurrent_submissions_share_one_batch(
+        self, sample_raw_extraction_result: RawExtractionResult
+    ) -> None:
+        handler = _RecordingBatchHandler(sample_raw_extraction_result)
+        batcher = MicroBatcher(handler, max_size=10, window=0.01)
+        batcher.start()
+
+        results = await asyncio.gather(*(batcher.submit(f"job {i}") for i in range(3)))
+        await batcher.stop()
+
+        assert handler.batches == [["job 0", "job 1", "job 2"]]
+        assert all(r is sample_raw_extraction_result for r in results)
+
+    async def test_full_batch_is_sent_without_waiting_for_window(
+        self, sample_raw_extraction_result: RawExtractionResult
+    ) -> None:
+        handler = _RecordingBatchHandler(sample_raw_extraction_result)
+        # A window this long would time the test out if it were waited for
+        batcher = MicroBatcher(handler, max_size=2, window=60)
+        batcher.start()
+
+        await asyncio.wait_for(
+            asyncio.gather(batcher.submit("a"), batcher.submit("b")), timeout=1
+        )
+        await batcher.stop()
+
+        assert handler.batches == [["a", "b"]]
+
+    async def test_failed_item_raises_for_its_submitter_only(
+        self, sample_raw_extraction_result: RawExtractionResult
+    ) -> None:
+        handler = _RecordingBatchHandler(sample_raw_extraction_result)
+        batcher = MicroBatcher(handler, max_size=2, window=0.01)
+        batcher.start()
+
+        ok, failed = await asyncio.gather(
+            batcher.submit("ok"), batcher.submit("expired"), return_exceptions=True
+        )
+        await batcher.stop()
+
+        assert ok is sample_raw_extraction_result
+        assert isinstance(failed, ExtractionError)
+        assert "expired" in failed.message
+
+    async def test_handler_error_fails_every_submitter(self) -> None:
+        async def failing_handler(
+            _job_texts: list[str],
+        ) -> list[RawExtractionResult | ExtractionError]:
+            raise RuntimeError("Connection lost")
+
+        batcher = MicroBatcher(failing_handler, max_size=2, window=0.01)
+        batcher.start()
+
+        results = await asyncio.gather(
+            batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+        )
+        await batcher.stop()
+
+        assert all(isinstance(r, ExtractionError) for r in results)
+        assert all("Connection lost" in str(r) for r in results)
+
+    async def test_stop_cancels_pending_submissions(self) -> None:
+        async def never_returning_handler(
+            _job_texts: list[str],
+        ) -> list[RawExtractionResult | ExtractionError]:
+            await asyncio.Event().wait()
+            return []
+
+        batcher = MicroBatcher(never_returning_handler, max_size=1, window=0.01)
+        batcher.start()
+        pending = asyncio.create_task(batcher.submit("a"))
+        await asyncio.sleep(0.01)
+
+        await batcher.stop()
+
+        with pytest.raises(asyncio.CancelledError):
+            await pending
+
+    async def test_stop_cancels_submissions_still_being_collected(
+        self, sample_raw_extraction_result: RawExtractionResult
+    ) -> None:
+        handler = _RecordingBatchHandler(sample_raw_extraction_result)
+        batcher = MicroBatcher(handler, max_size=10, window=60)
+        batcher.start()
+        pending = asyncio.create_task(batcher.submit("a"))
+        # Let the collector take the item off the queue and start its window
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        await batcher.stop()
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(pending, timeout=1)
+        assert handler.batches == []
+
+    async def test_wrong_number_of_results_fails_every_submitter(self) -> None:
+        async def short_handler(
+            _job_texts: list[str],
+        ) -> list[RawExtractionResult | ExtractionError]:
+            return []
+
+        batcher = MicroBatcher(short_handler, max_size=2, window=0.01)
+        batcher.start()
+
+        results = await asyncio.gather(
+            batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+        )
+        await batcher.stop()
+
+        assert all(isinstance(r, ExtractionError) for r in results)
+        assert all("returned 0 results for 2" in str(r) for r in results)
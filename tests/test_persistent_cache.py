@@ -0,0 +1,105 @@
+"""Tests for the SQLite-backed persistent cache."""
+
+import sqlite3
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import NoReturn
+
+import pytest
+
+from job_posting_extractor.models import JobExtractionResponse, JobPosting, UsageInfo
+from job_posting_extractor.services import persistent_cache
+from job_posting_extractor.services.persistent_cache import ExtractionCache
+
+KEY = b"\x01" * 16
+
+
+def _response(job_title: str) -> JobExtractionResponse:
+    return JobExtractionResponse(
+        job=JobPosting(job_title=job_title, company="TestCo"),
+        confidence="low",
+        raw_response="{}",
+        model="test-model",
+        usage=UsageInfo(input_tokens=10, output_tokens=20),
+    )
+
+
+def _locked(*_args: object) -> NoReturn:
+    raise sqlite3.OperationalError("database is locked")
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> str:
+    return str(tmp_path / "cache.db")
+
+
+@pytest.fixture
+async def cache(db_path: str) -> AsyncIterator[ExtractionCache]:
+    cache = ExtractionCache(db_path)
+    await cache.open()
+    yield cache
+    await cache.close()
+
+
+class TestExtractionCache:
+    """Tests for ExtractionCache lookups and storage."""
+
+    async def test_round_trips_response(self, cache: ExtractionCache) -> None:
+        response = _response("Senior Python Developer")
+        await cache.put(KEY, "model", response)
+
+        assert await cache.get(KEY, "model") == response
+
+    async def test_missing_key_is_a_miss(self, cache: ExtractionCache) -> None:
+        assert await cache.get(KEY, "model") is None
+
+    async def test_entries_are_namespaced_by_model(
+        self, cache: ExtractionCache
+    ) -> None:
+        await cache.put(KEY, "model-a", _response("Senior Python Developer"))
+
+        assert await cache.get(KEY, "model-b") is None
+
+    async def test_entries_are_shared_across_connections(
+        self, cache: ExtractionCache, db_path: str
+    ) -> None:
+        response = _response("Senior Python Developer")
+        await cache.put(KEY, "model", response)
+
+        other = ExtractionCache(db_path)
+        await other.open()
+        try:
+            assert await other.get(KEY, "model") == response
+        finally:
+            await other.close()
+
+    async def test_expired_entries_are_ignored(
+        self, cache: ExtractionCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        now = 1000.0
+        monkeypatch.setattr(persistent_cache, "time", lambda: now)
+        await cache.put(KEY, "model", _response("Senior Python Developer"))
+
+        now += 3601
+        assert await cache.get(KEY, "model") is None
+
+    async def test_uses_wal_journal(self, cache: ExtractionCache) -> None:
+        async with cache._connection.execute("PRAGMA journal_mode") as cursor:
+            assert await cursor.fetchone() == ("wal",)
+
+    async def test_failed_lookup_is_a_miss(
+        self, cache: ExtractionCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        await cache.put(KEY, "model", _response("Senior Python Developer"))
+        monkeypatch.setattr(cache._connection, "execute", _locked)
+
+        assert await cache.get(KEY, "model") is None
+
+    async def test_failed_store_is_skipped(
+        self, cache: ExtractionCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        with monkeypatch.context() as m:
+            m.setattr(cache._connection, "execute", _locked)
+            await cache.put(KEY, "model", _response("Senior Python Developer"))
+
+        assert await cache.get(KEY, "model") is None
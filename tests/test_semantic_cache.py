@@ -0,0 +1,142 @@
+"""Tests for the semantic (embedding) cache."""
+
+from collections.abc import Sequence
+
+import numpy as np
+import pytest
+
+from job_posting_extractor.models import JobExtractionResponse, JobPosting, UsageInfo
+from job_posting_extractor.services import semantic_cache
+from job_posting_extractor.services.semantic_cache import SemanticCache
+
+POSTING = "Senior Python Developer at TechCorp. " * 10
+REPOSTED = POSTING + " Apply now!"
+OTHER_POSTING = "Frontend Engineer at WebCo. " * 10
+
+
+class _FakeEmbedder:
+    """Embedder stub returning fixed vectors for known texts."""
+
+    VECTORS = {
+        POSTING: [1.0, 0.0, 0.0],
+        REPOSTED: [0.99, 0.05, 0.0],
+        OTHER_POSTING: [0.0, 1.0, 0.0],
+    }
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def embed(self, text: str) -> Sequence[float]:
+        self.calls.append(text)
+        return self.VECTORS[text]
+
+
+def _response(job_title: str) -> JobExtractionResponse:
+    return JobExtractionResponse(
+        job=JobPosting(job_title=job_title, company="TestCo"),
+        confidence="low",
+        raw_response="{}",
+        model="test-model",
+        usage=UsageInfo(input_tokens=10, output_tokens=20),
+    )
+
+
+@pytest.fixture
+def embedder() -> _FakeEmbedder:
+    return _FakeEmbedder()
+
+
+@pytest.fixture
+def cache(embedder: _FakeEmbedder) -> SemanticCache:
+    return SemanticCache(embedder, threshold=0.95, min_chars=200)
+
+
+class TestSemanticCache:
+    """Tests for SemanticCache lookups and storage."""
+
+    async def test_near_duplicate_is_a_hit(self, cache: SemanticCache) -> None:
+        response = _response("Senior Python Developer")
+        vector = await cache.embed(POSTING)
+        assert vector is not None
+        cache.put("model", vector, response)
+
+        repost_vector = await cache.embed(REPOSTED)
+        assert repost_vector is not None
+        assert cache.get("model", repost_vector) is response
+
+    async def test_dissimilar_posting_is_a_miss(self, cache: SemanticCache) -> None:
+        vector = await cache.embed(POSTING)
+        assert vector is not None
+        cache.put("model", vector, _response("Senior Python Developer"))
+
+        other_vector = await cache.embed(OTHER_POSTING)
+        assert other_vector is not None
+        assert cache.get("model", other_vector) is None
+
+    async def test_entries_are_namespaced(self, cache: SemanticCache) -> None:
+        vector = await cache.embed(POSTING)
+        assert vector is not None
+        cache.put("model-a", vector, _response("Senior Python Developer"))
+
+        assert cache.get("model-b", vector) is None
+
+    async def test_short_text_is_not_embedded(
+        self, cache: SemanticCache, embedder: _FakeEmbedder
+    ) -> None:
+        assert await cache.embed("Short posting") is None
+        assert embedder.calls == []
+
+    async def test_expired_entries_are_ignored(
+        self, cache: SemanticCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        now = 1000.0
+        monkeypatch.setattr(semantic_cache, "monotonic", lambda: now)
+        vector = await cache.embed(POSTING)
+        assert vector is not None
+        cache.put("model", vector, _response("Senior Python Developer"))
+
+        now += 3601
+        assert cache.get("model", vector) is None
+
+    async def test_oldest_entries_are_evicted(self, embedder: _FakeEmbedder) -> None:
+        cache = SemanticCache(embedder, min_chars=200, max_entries=1)
+        first = await cache.embed(POSTING)
+        second = await cache.embed(OTHER_POSTING)
+        assert first is not None
+        assert second is not None
+        cache.put("model", first, _response("Senior Python Developer"))
+        cache.put("model", second, _response("Frontend Engineer"))
+
+        assert cache.get("model", first) is None
+        hit = cache.get("model", second)
+        assert hit is not None
+        assert hit.job.job_title == "Frontend Engineer"
+
+    async def test_index_grows_past_its_initial_capacity(
+        self, cache: SemanticCache
+    ) -> None:
+        vectors = np.eye(40, dtype=np.float32)
+        for i, vector in enumerate(vectors):
+            cache.put("model", vector, _response(f"Job {i}"))
+
+        hits = [cache.get("model", vector) for vector in vectors]
+        assert [hit.job.job_title if hit else None for hit in hits] == [
+            f"Job {i}" for i in range(40)
+        ]
+
+    async def test_full_index_overwrites_oldest_entries(
+        self, embedder: _FakeEmbedder
+    ) -> None:
+        cache = SemanticCache(embedder, min_chars=200, max_entries=3)
+        vectors = np.eye(5, dtype=np.float32)
+        for i, vector in enumerate(vectors):
+            cache.put("model", vector, _response(f"Job {i}"))
+
+        hits = [cache.get("model", vector) for vector in vectors]
+        assert [hit.job.job_title if hit else None for hit in hits] == [
+            None,
+            None,
+            "Job 2",
+            "Job 3",
+            "Job 4",
+        ]